@@ -1,8 +1,12 @@
 import math
-from utils import debug_decorator
+from bisect import bisect_left
+from collections import OrderedDict
+import numpy as np
+from series_acceleration import wynn_accelerate
+from utils import profile_decorator
 
-@debug_decorator
-def calculate_series(x: float, eps: float) -> tuple:
+@profile_decorator
+def calculate_series(x: float, eps: float, accelerate: bool = False) -> tuple:
     """
     Calculate the series expansion of the function f(x) = 1/(1-x)
     using the power series: f(x) = 1 + x + x^2 + ... for |x| < 1,
@@ -10,16 +14,21 @@ def calculate_series(x: float, eps: float) -> tuple:
 
     The function accumulates terms until the absolute error between the
     computed series sum and the exact value (using math) is less than eps.
+    The summation is plain Python, which is the fastest choice for a single
+    point; calculate_series_batch handles whole arrays. With accelerate set,
+    calculate_series_accelerated is used instead.
 
     Parameters:
         x (float): The input value, must satisfy |x| < 1.
         eps (float): The desired accuracy (error threshold).
+        accelerate (bool): Use Wynn epsilon acceleration of the partial sums.
 
     Returns:
         tuple: A tuple containing:
             - x (float): The input value.
             - n (int): The number of terms summed.
-            - series_sum (float): The computed sum from the series.
+            - series_sum (float): The computed sum from the series
+              (the accelerated estimate if accelerate is True).
             - exact_value (float): The exact function value computed as 1/(1-x).
             - eps (float): The used accuracy threshold.
 
@@ -29,18 +38,319 @@ def calculate_series(x: float, eps: float) -> tuple:
     if abs(x) >= 1:
         raise ValueError("x must be less than 1 in absolute value for series convergence.")
 
+    if accelerate:
+        n, series_sum = calculate_series_accelerated(x, eps)
+        return (x, n, series_sum, 1 / (1 - x), eps)
+
+    n, series_sum, exact_value, _ = _sum_series(x, eps, 500)
+    return (x, n, series_sum, exact_value, eps)
+
+def _sum_series(x: float, eps: float, max_iter: int) -> tuple:
+    """
+    Sum the series for one point in plain Python.
+
+    Returns:
+        tuple: (n, series_sum, exact_value, error).
+    """
     series_sum = 0.0
     n = 0
     error = math.inf
     exact_value = 1 / (1 - x)
 
-    while error > eps and n < 500:
-        term = x ** n
-        series_sum += term
+    while error > eps and n < max_iter:
+        series_sum += x ** n
         error = abs(exact_value - series_sum)
         n += 1
 
-    return (x, n, series_sum, exact_value, eps)
+    return n, series_sum, exact_value, error
+
+def calculate_series_batch(x, eps, max_iter: int = 500) -> tuple:
+    """
+    Vectorized version of calculate_series for whole arrays of x and eps.
+
+    Every element follows the same stopping rule as the scalar function:
+    terms x^n are accumulated until |exact_value - series_sum| <= eps or
+    max_iter terms have been summed. Elements that have already converged
+    are dropped from the working set, so each iteration only touches the
+    points that still need more terms.
+
+    The terms are kept as a float64 running product (term *= x), as in the LR4
+    kernel. Its rounding differs from Python's x ** n in the last bits, so for eps
+    close to the rounding error n and series_sum can differ slightly from
+    calculate_series.
+    Scalar inputs skip the array setup and are summed in plain Python, exactly
+    like calculate_series.
+
+    Parameters:
+        x (array_like): Input values, each must satisfy |x| < 1.
+        eps (array_like): Accuracy thresholds, broadcast against x.
+        max_iter (int): Maximum number of terms per element (default is 500).
+
+    Returns:
+        tuple: A tuple of arrays with the broadcast shape of x and eps:
+            - n (ndarray of int): The number of terms summed.
+            - series_sum (ndarray): The computed sums of the series.
+            - exact_value (ndarray): The exact values 1/(1-x).
+            - error (ndarray): The final absolute errors.
+
+    Raises:
+        ValueError: If any |x| >= 1 (series does not converge).
+    """
+    if np.ndim(x) == 0 and np.ndim(eps) == 0:
+        x, eps = float(x), float(eps)
+        if abs(x) >= 1:
+            raise ValueError("x must be less than 1 in absolute value for series convergence.")
+        return tuple(np.asarray(value) for value in _sum_series(x, eps, max_iter))
+
+    x, eps = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(eps, dtype=float))
+    shape = x.shape
+    x = x.ravel()
+    eps = eps.ravel()
+    if np.any(np.abs(x) >= 1):
+        raise ValueError("x must be less than 1 in absolute value for series convergence.")
+
+    exact_value = 1 / (1 - x)
+    series_sum = np.zeros_like(x)
+    error = np.full_like(x, math.inf)
+    n = np.zeros(x.shape, dtype=int)
+
+    # Working set: indices of the elements that have not converged yet.
+    active = np.flatnonzero(error > eps)
+    x_act, eps_act, exact_act = x[active], eps[active], exact_value[active]
+    sum_act = series_sum[active]
+    term_act = np.ones_like(x_act)
+    for k in range(max_iter):
+        if active.size == 0:
+            break
+        sum_act += term_act
+        term_act *= x_act
+        err_act = np.abs(exact_act - sum_act)
+        done = err_act <= eps_act
+        if k + 1 == max_iter:
+            done[:] = True
+        if done.any():
+            finished = active[done]
+            series_sum[finished] = sum_act[done]
+            error[finished] = err_act[done]
+            n[finished] = k + 1
+            keep = ~done
+            active = active[keep]
+            x_act, eps_act, exact_act = x_act[keep], eps_act[keep], exact_act[keep]
+            sum_act, term_act = sum_act[keep], term_act[keep]
+
+    return (n.reshape(shape), series_sum.reshape(shape),
+            exact_value.reshape(shape), error.reshape(shape))
+
+def iter_series(x: float, eps: float, max_iter: int = 500):
+    """
+    Lazily yield the convergence trace of the series for f(x) = 1/(1-x).
+
+    The summation follows calculate_series term by term, so the last
+    yielded item corresponds to its final result. Nothing is stored
+    between terms, which keeps memory constant for any number of traces.
+
+    Parameters:
+        x (float): The input value, must satisfy |x| < 1.
+        eps (float): The desired accuracy (error threshold).
+        max_iter (int): Maximum number of terms (default is 500).
+
+    Yields:
+        tuple: (n, partial_sum, error) after each added term.
+
+    Raises:
+        ValueError: If |x| >= 1 (series does not converge).
+    """
+    if abs(x) >= 1:
+        raise ValueError("x must be less than 1 in absolute value for series convergence.")
+
+    exact_value = 1 / (1 - x)
+    series_sum = 0.0
+    n = 0
+    error = math.inf
+
+    while error > eps and n < max_iter:
+        series_sum += x ** n
+        error = abs(exact_value - series_sum)
+        n += 1
+        yield (n, series_sum, error)
+
+def _partial_sums(x: float, max_iter: int):
+    """
+    Yield the partial sums of the series, with the terms computed as in calculate_series.
+    """
+    series_sum = 0.0
+    for n in range(max_iter):
+        series_sum += x ** n
+        yield series_sum
+
+def calculate_series_accelerated(x: float, eps: float, max_iter: int = 500) -> tuple:
+    """
+    Sum the series for f(x) = 1/(1-x) with Wynn epsilon acceleration.
+
+    Terms x^n are added one by one and every partial sum is passed through
+    the epsilon table (see series_acceleration.wynn_accelerate). The loop stops
+    when the accelerated estimate is within eps of the exact value; for |x|
+    close to 1 this takes a handful of terms instead of all 500. If eps is
+    never reached, the most stable estimate is returned rather than the last.
+
+    Parameters:
+        x (float): The input value, must satisfy |x| < 1.
+        eps (float): The desired accuracy (error threshold).
+        max_iter (int): Maximum number of terms (default is 500).
+
+    Returns:
+        tuple: (n, estimate) - the number of terms used and the accelerated sum.
+    """
+    exact_value = 1 / (1 - x)
+    return wynn_accelerate(_partial_sums(x, max_iter),
+                           lambda estimate: abs(exact_value - estimate) <= eps)
+
+class _SeriesState:
+    """
+    Stored partial-sum prefix of the series for one value of x.
+
+    Attributes:
+        exact_value (float): The exact value 1/(1-x).
+        term (float): The next term to add, x^len(sums).
+        sums (list): sums[k] is the partial sum of the first k + 1 terms.
+        neg_min_errors (list): Negated running minimum of the absolute error,
+            non-decreasing, so it can be searched with bisect.
+    """
+
+    def __init__(self, x: float):
+        self.exact_value = 1 / (1 - x)
+        self.term = 1.0
+        self.sums = []
+        self.neg_min_errors = []
+
+    def extend(self, x: float, eps: float, max_iter: int):
+        """
+        Continue the summation from the stored prefix until the error is <= eps
+        or max_iter terms have been summed.
+        """
+        n = len(self.sums)
+        series_sum = self.sums[-1] if self.sums else 0.0
+        term = self.term
+        min_error = -self.neg_min_errors[-1] if self.neg_min_errors else math.inf
+        while min_error > eps and n < max_iter:
+            series_sum += term
+            term *= x
+            min_error = min(min_error, abs(self.exact_value - series_sum))
+            self.sums.append(series_sum)
+            self.neg_min_errors.append(-min_error)
+            n += 1
+        self.term = term
+
+    def lookup(self, eps: float):
+        """
+        Return the number of terms needed for eps from the stored prefix,
+        or None if the prefix is too short.
+        """
+        n = bisect_left(self.neg_min_errors, -eps) + 1
+        return n if n <= len(self.sums) else None
+
+class SeriesCache:
+    """
+    LRU cache of partial-sum state of the series for f(x) = 1/(1-x), keyed by x.
+
+    Repeated requests for the same x with a tighter eps continue the summation
+    from the stored (n, partial_sum, term) with term *= x instead of starting
+    from term 0, and requests with a looser eps are answered by a binary search
+    on the stored prefix. Because the terms are a running product rather than
+    x ** n, sums can differ from calculate_series in the last bits, and so can
+    n for eps at the level of the rounding error.
+
+    Attributes:
+        maxsize (int): Maximum number of values of x kept in the cache.
+        max_iter (int): Maximum number of terms per value of x.
+        hits (int): Requests answered from the stored prefix (including prefixes
+            that already reached max_iter).
+        misses (int): Requests for a value of x that was not cached.
+        extensions (int): Requests that extended an already cached prefix.
+        evictions (int): Entries dropped because the cache was full.
+    """
+
+    def __init__(self, maxsize: int = 1024, max_iter: int = 500):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self.max_iter = max_iter
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.extensions = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def calculate(self, x: float, eps: float) -> tuple:
+        """
+        Cached equivalent of calculate_series.
+
+        Parameters:
+            x (float): The input value, must satisfy |x| < 1.
+            eps (float): The desired accuracy (error threshold).
+
+        Returns:
+            tuple: (x, n, series_sum, exact_value, eps), as in calculate_series.
+
+        Raises:
+            ValueError: If |x| >= 1 (series does not converge).
+        """
+        if abs(x) >= 1:
+            raise ValueError("x must be less than 1 in absolute value for series convergence.")
+
+        state = self._entries.get(x)
+        if state is None:
+            self.misses += 1
+            state = _SeriesState(x)
+            self._entries[x] = state
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._entries.move_to_end(x)
+
+        if not eps < math.inf:
+            # Even the empty sum satisfies the threshold.
+            return (x, 0, 0.0, state.exact_value, eps)
+
+        n = state.lookup(eps)
+        if n is not None:
+            self.hits += 1
+        elif len(state.sums) >= self.max_iter:
+            # The prefix cannot grow any more; its last sum is the answer.
+            self.hits += 1
+            n = len(state.sums)
+        else:
+            if state.sums:
+                self.extensions += 1
+            state.extend(x, eps, self.max_iter)
+            n = state.lookup(eps)
+            if n is None:
+                n = len(state.sums)
+        return (x, n, state.sums[n - 1], state.exact_value, eps)
+
+    def info(self) -> dict:
+        """
+        Return the cache counters and current size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "extensions": self.extensions,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """
+        Drop all cached entries and reset the counters.
+        """
+        self._entries.clear()
+        self.hits = self.misses = self.extensions = self.evictions = 0
 
 def print_series_table(result: tuple):
     """
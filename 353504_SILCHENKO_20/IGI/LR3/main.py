@@ -22,7 +22,7 @@ This main module integrates functionalities for several tasks:
 
 from business_functions import calculate_series, print_series_table
 from sequence_init import sequence_from_generator 
-from utils import get_int_input, get_float_input, repeat_execution
+from utils import get_int_input, get_float_input, get_yes_no, repeat_execution
 
 
 def sum_sequence_manual() -> int:
@@ -239,6 +239,8 @@ def menu():
                 eps = get_float_input("Enter the desired accuracy (eps): ")
                 result = calculate_series(x, eps)
                 print_series_table(result)
+                if get_yes_no("Compare with accelerated (Wynn epsilon) summation? (y/n): "):
+                    print_series_table(calculate_series(x, eps, accelerate=True))
             except Exception as e:
                 print("An error occurred:", e)
         elif choice == 2:
@@ -0,0 +1,117 @@
+"""
+Lab Assignment: Python Lab 3 - Series Convergence Traces
+Version: 1.0
+Developer: Silchenko Anna Andreevna
+Date: 2026-10-17
+
+This module streams the full convergence trajectory of the series for f(x) = 1/(1-x)
+to a file. Traces are produced term by term by business_functions.iter_series and
+written in fixed-size chunks, so memory use does not depend on the number of points:
+    - CSV: one text row "x,eps,n,partial_sum,error" per term.
+    - Binary: a short header followed by packed little-endian records of
+      (x: float64, eps: float64, n: uint32, partial_sum: float64, error: float64),
+      which can be read back lazily with load_binary_traces.
+"""
+
+import csv
+import numpy as np
+from business_functions import iter_series
+
+TRACE_MAGIC = b"SERTRC2\n"
+
+TRACE_DTYPE = np.dtype([
+    ("x", "<f8"),
+    ("eps", "<f8"),
+    ("n", "<u4"),
+    ("partial_sum", "<f8"),
+    ("error", "<f8"),
+])
+
+
+def write_series_traces(points, filename: str, fmt: str = "binary",
+                        chunk_size: int = 8192, max_iter: int = 500) -> int:
+    """
+    Stream the convergence traces of many (x, eps) points to a file.
+
+    Parameters:
+        points (iterable): Pairs (x, eps); may be a generator of any length.
+        filename (str): The output file name.
+        fmt (str): "binary" or "csv".
+        chunk_size (int): Number of trace rows buffered before each write.
+        max_iter (int): Maximum number of terms per point (default is 500).
+
+    Returns:
+        int: The total number of trace rows written.
+
+    Raises:
+        ValueError: If fmt is unknown or chunk_size is not positive.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    if fmt == "binary":
+        return _write_binary(points, filename, chunk_size, max_iter)
+    if fmt == "csv":
+        return _write_csv(points, filename, chunk_size, max_iter)
+    raise ValueError("fmt must be 'binary' or 'csv'.")
+
+
+def _write_binary(points, filename: str, chunk_size: int, max_iter: int) -> int:
+    """
+    Write traces as packed TRACE_DTYPE records through a reused chunk buffer.
+    """
+    buffer = np.empty(chunk_size, dtype=TRACE_DTYPE)
+    filled = 0
+    total = 0
+    with open(filename, "wb") as f:
+        f.write(TRACE_MAGIC)
+        for x, eps in points:
+            for n, partial_sum, error in iter_series(x, eps, max_iter):
+                buffer[filled] = (x, eps, n, partial_sum, error)
+                filled += 1
+                if filled == chunk_size:
+                    f.write(buffer.tobytes())
+                    total += filled
+                    filled = 0
+        f.write(buffer[:filled].tobytes())
+        total += filled
+    return total
+
+
+def _write_csv(points, filename: str, chunk_size: int, max_iter: int) -> int:
+    """
+    Write traces as CSV rows, flushing every chunk_size rows.
+    """
+    rows = []
+    total = 0
+    with open(filename, "w", newline='', encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["x", "eps", "n", "partial_sum", "error"])
+        for x, eps in points:
+            for n, partial_sum, error in iter_series(x, eps, max_iter):
+                rows.append((repr(x), repr(eps), n, repr(partial_sum), repr(error)))
+                if len(rows) == chunk_size:
+                    writer.writerows(rows)
+                    total += len(rows)
+                    rows.clear()
+        writer.writerows(rows)
+        total += len(rows)
+    return total
+
+
+def load_binary_traces(filename: str) -> np.ndarray:
+    """
+    Open a binary trace file written by write_series_traces without reading it into memory.
+
+    Parameters:
+        filename (str): The trace file name.
+
+    Returns:
+        np.ndarray: A read-only memory-mapped record array of dtype TRACE_DTYPE.
+
+    Raises:
+        ValueError: If the file does not start with the trace header.
+    """
+    with open(filename, "rb") as f:
+        if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f"{filename} is not a series trace file.")
+    return np.memmap(filename, dtype=TRACE_DTYPE, mode="r", offset=len(TRACE_MAGIC))
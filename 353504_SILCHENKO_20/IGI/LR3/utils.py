@@ -5,28 +5,181 @@ Developer: Anna Ivanova
 Date: 2025-04-23
 
 This module provides utility functions such as decorators and input validation helpers
-to support the core functionalities.
+to support the core functionalities. profile_decorator records call statistics into
+an in-process registry (PROFILE_REGISTRY) that can be switched on and off at runtime
+and dumped as JSON.
 """
 
+import functools
+import json
+import random
+import threading
 import time
 
-def debug_decorator(func):
+class FunctionStats:
     """
-    A decorator that prints debugging information about the function's execution.
-    
+    Call statistics of one profiled function.
+
+    Attributes:
+        calls (int): Number of calls while profiling was enabled.
+        sampled (int): Number of calls that were timed.
+        total_ns (int): Total time of the timed calls in nanoseconds.
+        min_ns (int): Fastest timed call.
+        max_ns (int): Slowest timed call.
+        histogram (list): histogram[b] counts timed calls with duration
+            below 2**b nanoseconds and at least 2**(b-1) nanoseconds.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.sampled = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.histogram = [0] * 64
+
+    def to_dict(self) -> dict:
+        """
+        Return the statistics as a JSON-serializable dictionary.
+        """
+        return {
+            "calls": self.calls,
+            "sampled": self.sampled,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.sampled if self.sampled else None,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "histogram": [{"lt_ns": 2 ** b, "count": c} for b, c in enumerate(self.histogram) if c],
+        }
+
+class ProfileRegistry:
+    """
+    In-process registry of call statistics collected by profile_decorator.
+
+    Profiling is disabled by default; while disabled the decorated functions
+    only pay for one attribute check per call.
+
+    Attributes:
+        enabled (bool): Whether calls are being recorded.
+        sample_rate (float): Fraction of calls that are timed (0 to 1).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def enable(self, sample_rate: float = 1.0):
+        """
+        Start recording calls, timing the given fraction of them.
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        self.sample_rate = sample_rate
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording calls. The collected statistics are kept.
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Drop all collected statistics.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def _get(self, name: str) -> FunctionStats:
+        """Return the statistics of a function, creating them on first use."""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats.setdefault(name, FunctionStats())
+        return stats
+
+    def count(self, name: str):
+        """
+        Record an untimed call.
+        """
+        with self._lock:
+            self._get(name).calls += 1
+
+    def record(self, name: str, elapsed_ns: int):
+        """
+        Record a timed call that took elapsed_ns nanoseconds.
+        """
+        with self._lock:
+            stats = self._get(name)
+            stats.calls += 1
+            stats.sampled += 1
+            stats.total_ns += elapsed_ns
+            if stats.min_ns is None or elapsed_ns < stats.min_ns:
+                stats.min_ns = elapsed_ns
+            if elapsed_ns > stats.max_ns:
+                stats.max_ns = elapsed_ns
+            stats.histogram[min(elapsed_ns.bit_length(), 63)] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Return the statistics of all functions as a dictionary keyed by qualified name.
+        """
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def to_json(self, indent: int = 2) -> str:
+        """
+        Return the snapshot as a JSON string.
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def dump_json(self, filename: str):
+        """
+        Write the snapshot as JSON to the given file.
+        """
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+PROFILE_REGISTRY = ProfileRegistry()
+
+def profile_decorator(func=None, *, registry: ProfileRegistry = None, sample_rate: float = None):
+    """
+    A decorator that records call counts and latencies of the function.
+
+    Timing uses time.perf_counter_ns and nothing is printed. Calls are only
+    recorded while the registry is enabled, so the decorator can stay on hot
+    functions permanently.
+
     Parameters:
         func (callable): The function to be decorated.
-        
+        registry (ProfileRegistry): Registry to record into (default: PROFILE_REGISTRY).
+        sample_rate (float): Fraction of calls to time for this function; defaults to the
+            registry's sample_rate. Untimed calls are still counted.
+
     Returns:
-        callable: The wrapped function that prints debug details when executed.
+        callable: The wrapped function.
     """
+    if func is None:
+        return functools.partial(profile_decorator, registry=registry, sample_rate=sample_rate)
+    if registry is None:
+        registry = PROFILE_REGISTRY
+    name = f"{func.__module__}.{func.__qualname__}"
+    perf_counter_ns = time.perf_counter_ns
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"Executing {func.__name__} with args: {args} kwargs: {kwargs}")
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"{func.__name__} completed in {end_time - start_time:.6f} seconds\n")
-        return result
+        if not registry.enabled:
+            return func(*args, **kwargs)
+        rate = registry.sample_rate if sample_rate is None else sample_rate
+        if rate < 1 and random.random() >= rate:
+            registry.count(name)
+            return func(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            registry.record(name, perf_counter_ns() - start)
     return wrapper
 
 def get_int_input(prompt: str) -> int:
@@ -63,15 +216,15 @@ def get_float_input(prompt: str) -> float:
         except ValueError:
             print("Invalid input. Please enter a valid float number.")
 
-def repeat_execution(prompt: str = "Do you want to repeat the operation? (y/n): ") -> bool:
+def get_yes_no(prompt: str) -> bool:
     """
-    Ask the user whether to repeat an operation without exiting the program.
+    Ask the user a yes/no question.
     
     Parameters:
-        prompt (str): The prompt message.
+        prompt (str): The question displayed to the user.
         
     Returns:
-        bool: True if user chooses to repeat, False otherwise.
+        bool: True if the user answers yes, False otherwise.
     """
     while True:
         ans = input(prompt).strip().lower()
@@ -81,3 +234,15 @@ def repeat_execution(prompt: str = "Do you want to repeat the operation? (y/n):
             return False
         else:
             print("Invalid input. Please type 'y' or 'n'.")
+
+def repeat_execution(prompt: str = "Do you want to repeat the operation? (y/n): ") -> bool:
+    """
+    Ask the user whether to repeat an operation without exiting the program.
+    
+    Parameters:
+        prompt (str): The prompt message.
+        
+    Returns:
+        bool: True if user chooses to repeat, False otherwise.
+    """
+    return get_yes_no(prompt)
@@ -10,11 +10,63 @@ Purpose:
     This module manages student records using file serialization.
     It provides functionalities to store student records in CSV and Pickle formats,
     and to perform searches and sorting of records based on street and house number.
+    All serializers replace their files atomically (temporary file plus rename), and
+    PickleStudentSerializer can append only the changed records to a log segment.
+    BinaryStudentSerializer writes fixed-width records that can be read through mmap, and
+    SQLiteStudentSerializer answers searches with indexed queries against the database.
+    IndexedStudentStore keeps hash indexes on street and house so that searches do not
+    scan the whole list.
 """
 
+import asyncio
 import csv
+import mmap
 import pickle
 import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+
+def _create_temp_file(filename: str) -> tuple:
+    """
+    Create a temporary file in the directory of filename (so it can be renamed over it).
+
+    Returns:
+        tuple: (file descriptor, temporary path).
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(filename) + ".", suffix=".tmp")
+    mode = os.stat(filename).st_mode & 0o777 if os.path.exists(filename) else 0o644
+    os.chmod(temp_path, mode)
+    return fd, temp_path
+
+@contextmanager
+def atomic_write(filename: str, mode: str = "w", **kwargs):
+    """
+    Open a temporary file for writing and rename it over filename when the block succeeds.
+
+    A crash or exception in the middle of the write leaves the previous file untouched.
+
+    Parameters:
+        filename (str): The file to replace.
+        mode (str): File mode ("w" or "wb").
+        kwargs: Extra arguments for open(), e.g. encoding or newline.
+    """
+    fd, temp_path = _create_temp_file(filename)
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
 
 class Student:
     """
@@ -47,10 +99,101 @@ class Student:
         """Implement less-than operator for sorting by surname."""
         return self.surname < other.surname
 
+class IndexedStudentStore:
+    """
+    A collection of students with hash indexes on street and house number.
+
+    Streets are indexed case-folded, so lookups are case-insensitive. The indexes
+    are updated on every add and remove, and each lookup costs O(1 + matches).
+    Students are kept in insertion order and are identified by object identity.
+    A student whose street or house changes must be removed and added again.
+    """
+
+    def __init__(self, students=()):
+        self._students = {}
+        self._by_street = {}
+        self._by_house = {}
+        self._by_street_house = {}
+        self.extend(students)
+
+    @staticmethod
+    def _street_key(street: str) -> str:
+        """Return the case-folded street used as the index key."""
+        return street.casefold()
+
+    def _index_keys(self, student: Student):
+        """Return (index, key) pairs under which the student is indexed."""
+        street = self._street_key(student.street)
+        return ((self._by_street, street),
+                (self._by_house, student.house),
+                (self._by_street_house, (street, student.house)))
+
+    def add(self, student: Student):
+        """
+        Add a student and index it. Adding the same object twice has no effect.
+        """
+        key = id(student)
+        if key in self._students:
+            return
+        self._students[key] = student
+        for index, index_key in self._index_keys(student):
+            index.setdefault(index_key, {})[key] = student
+
+    def extend(self, students):
+        """
+        Add several students.
+        """
+        for student in students:
+            self.add(student)
+
+    def remove(self, student: Student):
+        """
+        Remove a student and drop it from the indexes.
+
+        Raises:
+            KeyError: If the student is not in the store.
+        """
+        key = id(student)
+        del self._students[key]
+        for index, index_key in self._index_keys(student):
+            bucket = index[index_key]
+            del bucket[key]
+            if not bucket:
+                del index[index_key]
+
+    def __len__(self):
+        return len(self._students)
+
+    def __iter__(self):
+        return iter(list(self._students.values()))
+
+    def __contains__(self, student):
+        return id(student) in self._students
+
+    def by_street(self, street: str) -> list:
+        """
+        Return students living on the given street (case-insensitive).
+        """
+        return list(self._by_street.get(self._street_key(street), {}).values())
+
+    def by_house(self, house: int) -> list:
+        """
+        Return students living in the given house number.
+        """
+        return list(self._by_house.get(house, {}).values())
+
+    def by_street_and_house(self, street: str, house: int) -> list:
+        """
+        Return students living in the given house on the given street.
+        """
+        return list(self._by_street_house.get((self._street_key(street), house), {}).values())
+
 class StudentSerializer:
     """
     Base class for student record serialization.
     """
+    # Whether save() writes an iterable as it goes instead of first collecting all records.
+    STREAMING_SAVE = True
 
     def __init__(self, filename: str):
         self.filename = filename
@@ -69,57 +212,732 @@ class StudentSerializer:
         """
         raise NotImplementedError
 
+    async def save_async(self, students: list, executor=None):
+        """
+        Save student records in an executor without blocking the event loop.
+
+        Parameters:
+            students (list): The records to save.
+            executor: The executor to run save in (default: the loop's default thread pool).
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self.save, students)
+
+    async def load_async(self, executor=None) -> list:
+        """
+        Load student records in an executor without blocking the event loop.
+
+        Parameters:
+            executor: The executor to run load in (default: the loop's default thread pool).
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.load)
+
     def search_by_street(self, street: str, students: list) -> list:
         """
         Return list of students living on the given street.
+        An IndexedStudentStore is answered from its index instead of a scan.
         """
-        return [s for s in students if s.street.lower() == street.lower()]
+        if isinstance(students, IndexedStudentStore):
+            return students.by_street(street)
+        street = street.casefold()
+        return [s for s in students if s.street.casefold() == street]
 
     def search_by_house(self, house: int, students: list) -> list:
         """
         Return list of students living in the given house number.
+        An IndexedStudentStore is answered from its index instead of a scan.
         """
+        if isinstance(students, IndexedStudentStore):
+            return students.by_house(house)
         return [s for s in students if s.house == house]
 
+    def search_by_street_and_house(self, street: str, house: int, students: list) -> list:
+        """
+        Return list of students living in the given house on the given street.
+        """
+        if isinstance(students, IndexedStudentStore):
+            return students.by_street_and_house(street, house)
+        street = street.casefold()
+        return [s for s in students if s.house == house and s.street.casefold() == street]
+
 class CSVStudentSerializer(StudentSerializer):
     """
     CSV serializer for student records.
+
+    Rows that cannot be converted to a Student are not printed; they are counted
+    in bad_rows and error_counts (by exception type) and, if quarantine_filename
+    is set, copied there together with their line number and error message. The
+    quarantine file describes the latest load only: it is removed when a load starts
+    and written again only if that load finds bad rows.
     """
+    def __init__(self, filename: str, quarantine_filename: str = None):
+        super().__init__(filename)
+        self.quarantine_filename = quarantine_filename
+        self.bad_rows = 0
+        self.error_counts = {}
+
     def save(self, students: list):
-        with open(self.filename, "w", newline='', encoding="utf-8") as csvfile:
+        with atomic_write(self.filename, "w", newline='', encoding="utf-8") as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["surname", "street", "house", "apartment"])
             for student in students:
                 writer.writerow([student.surname, student.street, student.house, student.apartment])
 
-    def load(self) -> list:
-        students = []
+    def iter_load(self, batch_size: int = None):
+        """
+        Lazily read student records, one row at a time.
+
+        Only the current row (or batch) is held in memory, so the result can be fed
+        straight into search_by_street / search_by_house to filter files of any size.
+        The bad-row counters and the quarantine file are reset at the start of every call.
+
+        Parameters:
+            batch_size (int): If given, yield lists of up to batch_size students instead of single students.
+
+        Yields:
+            Student or list: The next student, or the next batch of students.
+        """
+        self.bad_rows = 0
+        self.error_counts = {}
+        if self.quarantine_filename and os.path.exists(self.quarantine_filename):
+            os.unlink(self.quarantine_filename)
         if not os.path.exists(self.filename):
-            return students
-        with open(self.filename, "r", newline='', encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                try:
-                    student = Student(row["surname"], row["street"], int(row["house"]), int(row["apartment"]))
-                    students.append(student)
-                except (ValueError, KeyError) as e:
-                    print("Error reading row:", row, ":", e)
-        return students
+            return
+        quarantine = None
+        batch = []
+        try:
+            with open(self.filename, "r", newline='', encoding="utf-8") as csvfile:
+                reader = csv.DictReader(csvfile)
+                for row in reader:
+                    try:
+                        student = Student(row["surname"], row["street"], int(row["house"]), int(row["apartment"]))
+                    except (ValueError, KeyError, TypeError) as e:
+                        self.bad_rows += 1
+                        error_name = type(e).__name__
+                        self.error_counts[error_name] = self.error_counts.get(error_name, 0) + 1
+                        if self.quarantine_filename:
+                            if quarantine is None:
+                                quarantine_file = open(self.quarantine_filename, "w", newline='', encoding="utf-8")
+                                quarantine = csv.writer(quarantine_file)
+                                quarantine.writerow(["line", "error"] + list(reader.fieldnames or []))
+                            values = [row.get(field) or "" for field in reader.fieldnames or []]
+                            quarantine.writerow([reader.line_num, f"{error_name}: {e}"] + values)
+                        continue
+                    if batch_size is None:
+                        yield student
+                    else:
+                        batch.append(student)
+                        if len(batch) >= batch_size:
+                            yield batch
+                            batch = []
+            if batch:
+                yield batch
+        finally:
+            if quarantine is not None:
+                quarantine_file.close()
+
+    def load(self) -> list:
+        return list(self.iter_load())
 
 class PickleStudentSerializer(StudentSerializer):
     """
     Pickle serializer for student records.
+
+    Every full save replaces the file atomically. With incremental=True, save()
+    writes only the records that changed since the last save or load, as one
+    entry appended to a log segment (filename + ".log"). load() replays the log
+    on top of the base snapshot. Once the log holds compact_threshold changed
+    records, it is folded into a new base snapshot, in a background thread
+    unless background_compaction is False.
+
+    The base file is a pickled list of students followed by a small trailer
+    {"token", "seq"}; plain pickle.load still reads just the list. Log entries
+    are (token, seq, changes) and are replayed only if their token matches the
+    base and their seq is newer, so a stale or partially written log entry is
+    ignored. Only one incremental serializer should write a given file at a time.
     """
-    def save(self, students: list):
-        with open(self.filename, "wb") as pfile:
+    LOG_SUFFIX = ".log"
+    # The snapshot is one pickled list, so save() needs all records in memory.
+    STREAMING_SAVE = False
+
+    def __init__(self, filename: str, incremental: bool = False, compact_threshold: int = 1000,
+                 background_compaction: bool = True):
+        super().__init__(filename)
+        self.incremental = incremental
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+        self.log_filename = filename + self.LOG_SUFFIX
+        self._lock = threading.RLock()
+        self._compactor = None
+        # Last persisted state: records as (surname, street, house, apartment) tuples.
+        self._state = None
+        self._token = None
+        self._seq = 0
+        self._log_changes = 0
+        self._log_end = 0
+
+    def __getstate__(self):
+        """
+        Pickle the settings only, so the serializer can be sent to a process pool.
+        The copy re-reads the store before its first incremental save.
+        """
+        state = self.__dict__.copy()
+        state.update(_lock=None, _compactor=None, _state=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    async def save_async(self, students: list, executor=None):
+        await super().save_async(students, executor)
+        if isinstance(executor, ProcessPoolExecutor):
+            # The save ran on a copy; re-read the store before the next incremental save.
+            with self._lock:
+                self._state = None
+
+    @staticmethod
+    def _record(student: Student) -> tuple:
+        """Return the fields of a student as a tuple."""
+        return (student.surname, student.street, student.house, student.apartment)
+
+    def _write_base(self, students: list, token: str, seq: int, fd=None):
+        """
+        Write a base snapshot with its trailer atomically (or into the given temporary file).
+        """
+        if fd is None:
+            with atomic_write(self.filename, "wb") as pfile:
+                pickle.dump(students, pfile)
+                pickle.dump({"token": token, "seq": seq}, pfile)
+            return
+        with open(fd, "wb") as pfile:
             pickle.dump(students, pfile)
+            pickle.dump({"token": token, "seq": seq}, pfile)
+            pfile.flush()
+            os.fsync(pfile.fileno())
 
-    def load(self) -> list:
+    def _read_log(self, token: str, seq: int):
+        """
+        Yield (seq, changes) of the log entries that apply on top of base (token, seq).
+        A truncated last entry (from an interrupted append) is ignored; the end of the
+        last complete entry is kept in _log_end so the next append can cut the torn tail.
+        """
+        self._log_end = 0
+        if token is None or not os.path.exists(self.log_filename):
+            return
+        with open(self.log_filename, "rb") as log:
+            while True:
+                try:
+                    entry_token, entry_seq, changes = pickle.load(log)
+                except Exception:
+                    # End of the log, or the torn tail of an interrupted append.
+                    return
+                self._log_end = log.tell()
+                if entry_token == token and entry_seq > seq:
+                    seq = entry_seq
+                    yield entry_seq, changes
+
+    @staticmethod
+    def _apply(state: list, changes: list):
+        """
+        Apply ("truncate", length) and ("set", index, record) changes to a list of records.
+        """
+        for change in changes:
+            if change[0] == "truncate":
+                del state[change[1]:]
+            else:
+                _, index, record = change
+                if index == len(state):
+                    state.append(record)
+                else:
+                    state[index] = record
+
+    @staticmethod
+    def _diff(old: list, new: list) -> list:
+        """
+        Return the changes that turn the record list old into new.
+        """
+        changes = []
+        if len(new) < len(old):
+            changes.append(("truncate", len(new)))
+        for index, record in enumerate(new):
+            if index >= len(old) or old[index] != record:
+                changes.append(("set", index, record))
+        return changes
+
+    def _read_store(self) -> tuple:
+        """
+        Read the base snapshot and replay the log.
+
+        Returns:
+            tuple: (students, records or None, token, seq, log_changes). records is None
+            when no log entry applied, in which case students is the base list as stored.
+        """
         if not os.path.exists(self.filename):
-            return []
+            return [], None, None, 0, 0
         with open(self.filename, "rb") as pfile:
             students = pickle.load(pfile)
-        return students
+            try:
+                trailer = pickle.load(pfile)
+            except EOFError:
+                trailer = {"token": None, "seq": 0}
+        token, seq = trailer["token"], trailer["seq"]
+        records = None
+        log_changes = 0
+        for seq, changes in self._read_log(token, seq):
+            if records is None:
+                records = [self._record(s) for s in students]
+            self._apply(records, changes)
+            log_changes += len(changes)
+        return students, records, token, seq, log_changes
+
+    def save(self, students: list):
+        if not isinstance(students, list):
+            students = list(students)
+        if not self.incremental:
+            with self._lock:
+                self._write_base(students, uuid.uuid4().hex, 0)
+                if os.path.exists(self.log_filename):
+                    os.unlink(self.log_filename)
+                self._state = None
+            return
+
+        with self._lock:
+            if self._state is None:
+                self._remember(*self._read_store())
+            new_state = [self._record(s) for s in students]
+            if self._token is None:
+                # No base snapshot yet: start a new lineage with a full save.
+                self._token = uuid.uuid4().hex
+                self._seq = 0
+                self._write_base(students, self._token, 0)
+                if os.path.exists(self.log_filename):
+                    os.unlink(self.log_filename)
+                self._log_changes = 0
+                self._log_end = 0
+            else:
+                changes = self._diff(self._state, new_state)
+                if changes:
+                    self._seq += 1
+                    with open(self.log_filename, "ab") as log:
+                        if log.tell() != self._log_end:
+                            log.truncate(self._log_end)
+                        pickle.dump((self._token, self._seq, changes), log)
+                        log.flush()
+                        os.fsync(log.fileno())
+                        self._log_end = log.tell()
+                    self._log_changes += len(changes)
+            self._state = new_state
+            needs_compaction = self._log_changes >= self.compact_threshold
+        if needs_compaction:
+            self.compact(background=self.background_compaction)
+
+    def _remember(self, students, records, token, seq, log_changes):
+        """Store the persisted state returned by _read_store."""
+        self._state = records if records is not None else [self._record(s) for s in students]
+        self._token = token
+        self._seq = seq
+        self._log_changes = log_changes
+
+    def compact(self, background: bool = False):
+        """
+        Fold the log into a new base snapshot and drop the folded log entries.
+
+        Parameters:
+            background (bool): Run in a background thread (at most one at a time).
+        """
+        if background:
+            with self._lock:
+                if self._compactor is not None and self._compactor.is_alive():
+                    return
+                self._compactor = threading.Thread(target=self._compact, name="student-log-compaction")
+                self._compactor.start()
+            return
+        self._compact()
+
+    def wait_for_compaction(self):
+        """
+        Block until a running background compaction has finished.
+        """
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def _compact(self):
+        """
+        Write the snapshot outside the lock, then swap it in and keep only newer log entries.
+        """
+        with self._lock:
+            if self._state is None:
+                self._remember(*self._read_store())
+            if self._token is None:
+                return
+            state = list(self._state)
+            token, seq, folded_changes = self._token, self._seq, self._log_changes
+            log_offset = self._log_end
+
+        fd, temp_path = _create_temp_file(self.filename)
+        try:
+            self._write_base([Student(*record) for record in state], token, seq, fd=fd)
+            with self._lock:
+                if token != self._token:
+                    # A full save started a new lineage meanwhile; this snapshot is stale.
+                    os.unlink(temp_path)
+                    return
+                os.replace(temp_path, self.filename)
+                if os.path.exists(self.log_filename):
+                    with open(self.log_filename, "rb") as log:
+                        log.seek(log_offset)
+                        tail = log.read()
+                    with atomic_write(self.log_filename, "wb") as log:
+                        log.write(tail)
+                    self._log_end -= log_offset
+                self._log_changes -= folded_changes
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def load(self) -> list:
+        with self._lock:
+            students, records, token, seq, log_changes = self._read_store()
+            if self.incremental:
+                self._remember(students, records, token, seq, log_changes)
+        if records is None:
+            return students
+        return [Student(*record) for record in records]
+
+class BinaryStudentReader:
+    """
+    Random-access reader for files written by BinaryStudentSerializer.
+
+    The file is memory-mapped; opening it only parses the header, record i is
+    decoded on demand in O(1), and iteration decodes one record at a time.
+    Use as a context manager or call close() when done.
+    """
+    # Records copied out of the mapping at a time by iter_records.
+    ITER_BLOCK = 4096
+
+    def __init__(self, filename: str):
+        self._file = open(filename, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filename} is not a binary student file.")
+        header = BinaryStudentSerializer.HEADER
+        if len(self._map) < header.size:
+            self.close()
+            raise ValueError(f"{filename} is not a binary student file.")
+        magic, self.record_count, self.string_count, self._blob_offset, self._records_offset = \
+            header.unpack_from(self._map, 0)
+        if magic != BinaryStudentSerializer.MAGIC:
+            self.close()
+            raise ValueError(f"{filename} is not a binary student file.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Unmap and close the file.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __len__(self):
+        return self.record_count
+
+    def _mapping(self) -> mmap.mmap:
+        """Return the mapping, or raise ValueError once the reader is closed."""
+        if self._map is None:
+            raise ValueError("I/O operation on a closed binary student file.")
+        return self._map
+
+    def string(self, index: int) -> str:
+        """
+        Decode string number index of the string table.
+        """
+        data = self._mapping()
+        start, end = struct.unpack_from("<QQ", data, BinaryStudentSerializer.HEADER.size + 8 * index)
+        return data[self._blob_offset + start:self._blob_offset + end].decode("utf-8")
+
+    def record(self, index: int) -> tuple:
+        """
+        Return the raw record (surname_index, street_index, house, apartment) without decoding strings.
+        """
+        if not 0 <= index < self.record_count:
+            raise IndexError("record index out of range")
+        record = BinaryStudentSerializer.RECORD
+        return record.unpack_from(self._mapping(), self._records_offset + index * record.size)
+
+    def __getitem__(self, index: int) -> Student:
+        if index < 0:
+            index += self.record_count
+        surname, street, house, apartment = self.record(index)
+        return Student(self.string(surname), self.string(street), house, apartment)
+
+    def iter_records(self):
+        """
+        Lazily yield raw records in file order, unpacked from blocks of ITER_BLOCK records.
+
+        Each block is copied out of the mapping as bytes, so no buffer export outlives a
+        yield and close() works even while an iterator is only partly consumed.
+        """
+        record = BinaryStudentSerializer.RECORD
+        end = self._records_offset + self.record_count * record.size
+        step = self.ITER_BLOCK * record.size
+        for start in range(self._records_offset, end, step):
+            yield from record.iter_unpack(self._mapping()[start:min(start + step, end)])
+
+    def __iter__(self):
+        strings = {}
+        for surname, street, house, apartment in self.iter_records():
+            if surname not in strings:
+                strings[surname] = self.string(surname)
+            if street not in strings:
+                strings[street] = self.string(street)
+            yield Student(strings[surname], strings[street], house, apartment)
+
+class BinaryStudentSerializer(StudentSerializer):
+    """
+    Binary serializer with fixed-width records.
+
+    Layout (little-endian):
+        header:   magic, record count, string count, blob offset, records offset
+        strings:  (string count + 1) uint64 offsets into the UTF-8 blob, then the blob
+        records:  (surname index uint32, street index uint32, house int32, apartment int32)
+    Distinct surnames and streets are stored once in the string table.
+    """
+    MAGIC = b"STUDBIN1"
+    HEADER = struct.Struct("<8sQQQQ")
+    RECORD = struct.Struct("<IIii")
+    # The string table precedes the records, so save() packs all records before writing.
+    STREAMING_SAVE = False
+
+    def save(self, students: list):
+        lookup = {}
+        strings = []
+        records = bytearray()
+        for student in students:
+            indices = []
+            for value in (student.surname, student.street):
+                index = lookup.get(value)
+                if index is None:
+                    index = lookup[value] = len(strings)
+                    strings.append(value.encode("utf-8"))
+                indices.append(index)
+            records += self.RECORD.pack(indices[0], indices[1], student.house, student.apartment)
+
+        offsets = [0]
+        for encoded in strings:
+            offsets.append(offsets[-1] + len(encoded))
+        blob_offset = self.HEADER.size + 8 * len(offsets)
+        records_offset = blob_offset + offsets[-1]
+        with atomic_write(self.filename, "wb") as bfile:
+            bfile.write(self.HEADER.pack(self.MAGIC, len(records) // self.RECORD.size, len(strings),
+                                         blob_offset, records_offset))
+            bfile.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+            bfile.write(b"".join(strings))
+            bfile.write(records)
+
+    def open(self) -> BinaryStudentReader:
+        """
+        Open the file for random access without reading the records.
+        """
+        return BinaryStudentReader(self.filename)
+
+    def iter_load(self):
+        """
+        Lazily yield student records one at a time.
+        """
+        if not os.path.exists(self.filename):
+            return
+        with self.open() as reader:
+            yield from reader
+
+    def load(self) -> list:
+        return list(self.iter_load())
+
+class SQLiteStudentSerializer(StudentSerializer):
+    """
+    SQLite serializer for student records with indexed queries.
+
+    One connection is opened on first use and reused until close(). The street
+    index stores the case-folded street, matching the case-insensitive search
+    of the base class. When no student list is given, the search methods query
+    the database directly.
+    """
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS students ("
+        " id INTEGER PRIMARY KEY,"
+        " surname TEXT NOT NULL,"
+        " street TEXT NOT NULL,"
+        " street_key TEXT NOT NULL,"
+        " house INTEGER NOT NULL,"
+        " apartment INTEGER NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS students_street ON students (street_key)",
+        "CREATE INDEX IF NOT EXISTS students_house ON students (house)",
+        "CREATE INDEX IF NOT EXISTS students_street_house ON students (street_key, house)",
+    )
+    COLUMNS = "surname, street, house, apartment"
+    # Rows fetched from the cursor at a time by iter_load.
+    FETCH_BATCH = 1000
+
+    def __init__(self, filename: str):
+        super().__init__(filename)
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getstate__(self):
+        """
+        Pickle the file name only; the copy opens its own connection on first use.
+        """
+        state = self.__dict__.copy()
+        state.update(_connection=None, _lock=None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The shared connection, created (together with the schema) on first use.
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename, check_same_thread=False)
+            with connection:
+                for statement in self.SCHEMA:
+                    connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """
+        Close the shared connection.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _query(self, where: str, parameters: tuple) -> list:
+        """Return students matching an SQL condition, in insertion order."""
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT {self.COLUMNS} FROM students WHERE {where} ORDER BY id", parameters).fetchall()
+        return [Student(*row) for row in rows]
+
+    def save(self, students: list):
+        rows = ((s.surname, s.street, s.street.casefold(), s.house, s.apartment) for s in students)
+        with self._lock:
+            connection = self.connection
+            with connection:
+                connection.execute("DELETE FROM students")
+                connection.executemany(
+                    "INSERT INTO students (surname, street, street_key, house, apartment) VALUES (?, ?, ?, ?, ?)",
+                    rows)
+
+    def iter_load(self):
+        """
+        Lazily yield student records in insertion order, FETCH_BATCH rows at a time.
+        """
+        with self._lock:
+            cursor = self.connection.execute(f"SELECT {self.COLUMNS} FROM students ORDER BY id")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(self.FETCH_BATCH)
+            if not rows:
+                break
+            for row in rows:
+                yield Student(*row)
+
+    def load(self) -> list:
+        with self._lock:
+            rows = self.connection.execute(f"SELECT {self.COLUMNS} FROM students ORDER BY id").fetchall()
+        return [Student(*row) for row in rows]
+
+    def search_by_street(self, street: str, students: list = None) -> list:
+        """
+        Return students living on the given street, using the street index.
+        """
+        if students is not None:
+            return super().search_by_street(street, students)
+        return self._query("street_key = ?", (street.casefold(),))
+
+    def search_by_house(self, house: int, students: list = None) -> list:
+        """
+        Return students living in the given house number, using the house index.
+        """
+        if students is not None:
+            return super().search_by_house(house, students)
+        return self._query("house = ?", (house,))
+
+    def search_by_street_and_house(self, street: str, house: int, students: list = None) -> list:
+        """
+        Return students living in the given house on the given street, using the composite index.
+        """
+        if students is not None:
+            return super().search_by_street_and_house(street, house, students)
+        return self._query("street_key = ? AND house = ?", (street.casefold(), house))
+
+async def save_all_async(students, serializers, executor=None):
+    """
+    Save the same records through several serializers from a coroutine.
+
+    The saves overlap only where they wait on I/O; see save_all. The serializers can be
+    pickled, so a ProcessPoolExecutor may be passed, but every process then receives
+    its own copy of the records, which for in-memory formats costs about as much as the save.
+
+    Parameters:
+        students (iterable): The records to save; read once into a list shared by all serializers.
+        serializers (iterable): The serializers to write, each to its own file.
+        executor: The executor to run the saves in (default: the loop's default thread pool).
+    """
+    students = list(students)
+    await asyncio.gather(*(serializer.save_async(students, executor) for serializer in serializers))
+
+def save_all(students, serializers, max_workers: int = None):
+    """
+    Save the same records through several serializers, each in its own thread.
+
+    This does not make saving faster in general: encoding CSV, pickle and binary records
+    is CPU-bound and runs under the GIL, so with local files save_all takes about as long
+    as calling save() on each serializer in turn. It only helps when the saves mostly
+    wait on I/O, e.g. on slow or network storage. Handing the saves to processes does
+    not help either, since sending the records to a process costs about as much as
+    encoding them.
+
+    Parameters:
+        students (iterable): The records to save; read once into a list shared by all serializers.
+        serializers (iterable): The serializers to write, each to its own file.
+        max_workers (int): Maximum number of threads (default: one per serializer).
+
+    Raises:
+        Exception: The first error raised by a save, after all saves have finished.
+    """
+    students = list(students)
+    serializers = list(serializers)
+    if not serializers:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers or len(serializers)) as pool:
+        futures = [pool.submit(serializer.save, students) for serializer in serializers]
+    for future in futures:
+        future.result()
 
 def create_sample_students() -> list:
     """
@@ -17,12 +17,26 @@ Purpose:
         and the penultimate character is a vowel.
     The analysis results are displayed on the screen, saved to a result file, and then the result
     file is archived using zipfile.
+    All global statistics are collected in a single scan of the text (scan_text).
+    analyze_text_file_streaming produces the same report while reading the file in chunks,
+    and scan_text_parallel / scan_text_file_parallel spread the scan over a process pool.
+    The chosen line is fetched through a persistent line offset index (line_index.LineIndex),
+    and files that only grow can be re-analyzed incrementally (scan_text_file_incremental).
 """
 
+import codecs
+import hashlib
+import json
 import re
 import zipfile
 import os
 import statistics
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from assignment1 import atomic_write
+from line_index import LineIndex
 
 def read_text_file(filename: str) -> str:
     """
@@ -40,10 +54,267 @@ def read_text_file(filename: str) -> str:
     with open(filename, "r", encoding="utf-8") as f:
         return f.read()
 
+VOWELS = "aeiouAEIOU"
+
+# Characters that end a line for str.splitlines (after universal newline translation).
+LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+LINE_BREAK_PATTERN = re.compile(f"[{LINE_BREAKS}]")
+
+# A complete sentence break: the whitespace after sentence-ending punctuation, followed by more text.
+SENTENCE_BREAK_PATTERN = re.compile(r'(?<=[.!?])\s+(?=\S)')
+
+# All tokens of the analysis in one pattern, matched in a single left-to-right scan.
+# A date is tried before a word, so it is matched whole at the start of its first number;
+# the break alternative is the whitespace that re.split(r'(?<=[.!?])\s+') splits sentences at.
+# No token contains whitespace, so a sentence break never falls inside another token.
+TOKEN_PATTERN = re.compile(
+    r'(?P<date>\b(?P<day>\d{1,2})[./-](?P<month>\d{1,2})[./-]2007\b)'
+    r'|(?P<emoticon>[:;]-*(?P<bracket>[\(\)\[\]])(?P=bracket)+)'
+    r'|(?P<word>\w+)'
+    r'|(?P<brk>(?<=[.!?])\s+)'
+)
+
+def is_special_word(word: str) -> bool:
+    """
+    Check whether the third from last letter of a word is a consonant and the penultimate letter is a vowel.
+    """
+    return len(word) >= 3 and (word[-3].lower() not in VOWELS) and (word[-2].lower() in VOWELS)
+
+class TextStatistics:
+    """
+    Aggregate results of scanning a text.
+
+    Statistics of texts that are split at sentence breaks can be combined with merge();
+    merging them in text order gives the statistics of the whole text.
+
+    Attributes:
+        sentence_counts (dict): Total, declarative, interrogative and exclamatory sentence counts.
+        sentence_letters (int): Sum of the word letters of all sentences that contain words.
+        sentences_with_words (int): Number of sentences that contain words.
+        word_count (int): Number of words.
+        word_letters (int): Total length of all words.
+        emoticons (int): Number of emoticons.
+        dates (list): Dates with the year 2007, in text order.
+        special_words (list): Special words, in text order.
+    """
+
+    def __init__(self):
+        self.sentence_counts = {"total": 0, "declarative": 0, "interrogative": 0, "exclamatory": 0}
+        self.sentence_letters = 0
+        self.sentences_with_words = 0
+        self.word_count = 0
+        self.word_letters = 0
+        self.emoticons = 0
+        self.dates = []
+        self.special_words = []
+
+    def add_sentence(self, sentence_end: str, letters: int, words: int):
+        """
+        Count one non-empty sentence ending with the character sentence_end.
+        """
+        self.sentence_counts["total"] += 1
+        if sentence_end == '.':
+            self.sentence_counts["declarative"] += 1
+        elif sentence_end == '?':
+            self.sentence_counts["interrogative"] += 1
+        elif sentence_end == '!':
+            self.sentence_counts["exclamatory"] += 1
+        if words:
+            self.sentence_letters += letters
+            self.sentences_with_words += 1
+
+    def merge(self, other: "TextStatistics") -> "TextStatistics":
+        """
+        Add the statistics of the text that follows this one and return self.
+        """
+        for key, value in other.sentence_counts.items():
+            self.sentence_counts[key] += value
+        self.sentence_letters += other.sentence_letters
+        self.sentences_with_words += other.sentences_with_words
+        self.word_count += other.word_count
+        self.word_letters += other.word_letters
+        self.emoticons += other.emoticons
+        self.dates.extend(other.dates)
+        self.special_words.extend(other.special_words)
+        return self
+
+    def average_sentence_length(self) -> float:
+        """Return the average number of word letters per sentence."""
+        if self.sentences_with_words:
+            return self.sentence_letters / self.sentences_with_words
+        return 0.0
+
+    def average_word_length(self) -> float:
+        """Return the average word length."""
+        if self.word_count:
+            return self.word_letters / self.word_count
+        return 0.0
+
+class TextScanner:
+    """
+    Collects TextStatistics from consecutive segments of a text, one pass over TOKEN_PATTERN each.
+
+    A text may be fed in several segments as long as every segment after the first starts
+    right after whitespace with a non-whitespace character (see safe_cut). Such cuts never
+    fall inside a token, and the state of the unfinished sentence is carried to the next
+    segment, so the result equals that of scanning the whole text at once.
+    """
+
+    def __init__(self):
+        self.stats = TextStatistics()
+        # Words and letters of the unfinished sentence, and its last non-whitespace character.
+        self._words = 0
+        self._letters = 0
+        self._last_char = ""
+
+    def feed(self, text: str):
+        """
+        Scan the next segment of the text.
+        """
+        stats = self.stats
+        special_words = stats.special_words
+        words, letters = self._words, self._letters
+        sentence_start = 0
+        for match in TOKEN_PATTERN.finditer(text):
+            kind = match.lastgroup
+            if kind == "word":
+                word = match.group()
+                length = len(word)
+                words += 1
+                letters += length
+                if length >= 3 and (word[-3].lower() not in VOWELS) and (word[-2].lower() in VOWELS):
+                    special_words.append(word)
+            elif kind == "brk":
+                # A break always follows the punctuation that ends the sentence.
+                stats.add_sentence(text[match.start() - 1], letters, words)
+                stats.word_count += words
+                stats.word_letters += letters
+                words = letters = 0
+                sentence_start = match.end()
+                self._last_char = ""
+            elif kind == "date":
+                # The numbers of a date are words too; none of them is a special word.
+                stats.dates.append(match.group())
+                words += 3
+                letters += len(match.group("day")) + len(match.group("month")) + 4
+            else:
+                stats.emoticons += 1
+        tail = text[sentence_start:].rstrip()
+        if tail:
+            self._last_char = tail[-1]
+        self._words, self._letters = words, letters
+
+    def finish(self) -> TextStatistics:
+        """
+        Count the unfinished sentence and return the statistics of the whole text.
+        """
+        stats = self.stats
+        if self._last_char:
+            stats.add_sentence(self._last_char, self._letters, self._words)
+        stats.word_count += self._words
+        stats.word_letters += self._letters
+        self._words = self._letters = 0
+        self._last_char = ""
+        return stats
+
+def safe_cut(text: str) -> int:
+    """
+    Return the last position where a text can be cut for TextScanner.feed.
+
+    This is the start of the last non-whitespace run that follows whitespace,
+    or 0 if there is no such position.
+    """
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    while i >= 0 and not text[i].isspace():
+        i -= 1
+    return i + 1 if i >= 0 else 0
+
+def scan_text(text: str) -> TextStatistics:
+    """
+    Collect all statistics of a text in one pass over TOKEN_PATTERN.
+
+    Parameters:
+        text (str): The text to scan.
+
+    Returns:
+        TextStatistics: The statistics of the text.
+    """
+    scanner = TextScanner()
+    scanner.feed(text)
+    return scanner.finish()
+
+def scan_text_file(filename: str, chunk_size: int = 1 << 20) -> tuple:
+    """
+    Collect the statistics and the line count of a text file, reading it in chunks.
+
+    Memory use is bounded by the chunk size (plus the longest run of text without
+    whitespace and the lists of dates and special words), not by the file size.
+
+    Parameters:
+        filename (str): The name of the file to read.
+        chunk_size (int): Number of characters read at a time.
+
+    Returns:
+        tuple: (stats, line_count) where line_count equals len(text.splitlines()).
+
+    Raises:
+        IOError: If the file cannot be opened.
+    """
+    scanner = TextScanner()
+    line_breaks = 0
+    last_char = ""
+    carry = ""
+    with open(filename, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            line_breaks += sum(chunk.count(char) for char in LINE_BREAKS)
+            last_char = chunk[-1]
+            text = carry + chunk
+            cut = safe_cut(text)
+            scanner.feed(text[:cut])
+            carry = text[cut:]
+    scanner.feed(carry)
+    if not last_char:
+        return scanner.finish(), 0
+    return scanner.finish(), line_breaks + (0 if last_char in LINE_BREAKS else 1)
+
+def read_line(filename: str, line_num: int, chunk_size: int = 1 << 20) -> str:
+    """
+    Return one line of a text file (1-based, as split by str.splitlines) without reading all of it into memory.
+
+    Raises:
+        IndexError: If the file has fewer lines.
+    """
+    current = 1
+    parts = []
+    with open(filename, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            pieces = LINE_BREAK_PATTERN.split(chunk)
+            for piece in pieces[:-1]:
+                if current == line_num:
+                    parts.append(piece)
+                    return "".join(parts)
+                current += 1
+            if current == line_num:
+                parts.append(pieces[-1])
+    if current == line_num and parts and "".join(parts):
+        return "".join(parts)
+    raise IndexError(f"{filename} has no line {line_num}.")
+
 class TextAnalyzer:
     """
     A class for analyzing text.
 
+    The text is scanned once when the analyzer is created, and every method
+    answers from the collected TextStatistics.
+
     Methods:
         analyze_sentences: Count total sentences and categorize them by type.
         average_sentence_length: Compute the average sentence length in terms of letters of words.
@@ -52,11 +323,26 @@ class TextAnalyzer:
         extract_dates: Extract dates matching the pattern with year 2007.
         extract_special_words: Extract words where the third from last letter is a consonant and the penultimate letter is a vowel.
     """
-    def __init__(self, text: str):
+    def __init__(self, text: str, stats: TextStatistics = None):
         self.text = text
-        # Split text into sentences (using lookbehind to include punctuation)
-        self.sentences = re.split(r'(?<=[.!?])\s+', text)
-        self.words = re.findall(r'\b\w+\b', text)
+        self.stats = scan_text(text) if stats is None else stats
+
+    @classmethod
+    def parallel(cls, text: str, workers: int = None) -> "TextAnalyzer":
+        """
+        Create an analyzer whose statistics are collected by scan_text_parallel.
+        """
+        return cls(text, scan_text_parallel(text, workers))
+
+    @property
+    def sentences(self) -> list:
+        """The text split into sentences (using lookbehind to include punctuation)."""
+        return re.split(r'(?<=[.!?])\s+', self.text)
+
+    @property
+    def words(self) -> list:
+        """All words of the text."""
+        return re.findall(r'\b\w+\b', self.text)
 
     def analyze_sentences(self) -> dict:
         """
@@ -65,19 +351,7 @@ class TextAnalyzer:
         Returns:
             dict: Contains total, declarative, interrogative, and exclamatory sentence counts.
         """
-        counts = {"total": 0, "declarative": 0, "interrogative": 0, "exclamatory": 0}
-        for sentence in self.sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-            counts["total"] += 1
-            if sentence.endswith('.'):
-                counts["declarative"] += 1
-            elif sentence.endswith('?'):
-                counts["interrogative"] += 1
-            elif sentence.endswith('!'):
-                counts["exclamatory"] += 1
-        return counts
+        return dict(self.stats.sentence_counts)
 
     def average_sentence_length(self) -> float:
         """
@@ -86,15 +360,7 @@ class TextAnalyzer:
         Returns:
             float: The average sentence length.
         """
-        lengths = []
-        for sentence in self.sentences:
-            words = re.findall(r'\b\w+\b', sentence)
-            word_lengths = [len(word) for word in words]
-            if word_lengths:
-                lengths.append(sum(word_lengths))
-        if lengths:
-            return sum(lengths) / len(lengths)
-        return 0.0
+        return self.stats.average_sentence_length()
 
     def average_word_length(self) -> float:
         """
@@ -103,10 +369,7 @@ class TextAnalyzer:
         Returns:
             float: The average length of words.
         """
-        if self.words:
-            total = sum(len(word) for word in self.words)
-            return total / len(self.words)
-        return 0.0
+        return self.stats.average_word_length()
 
     def count_emoticons(self) -> int:
         """
@@ -120,11 +383,7 @@ class TextAnalyzer:
         Returns:
             int: The number of valid emoticons found.
         """
-        # Improved regular expression:
-        pattern = re.compile(r'([:;])(-*)([\(\)\[\]])\3+')
-
-        emoticons = pattern.findall(self.text)
-        return len(emoticons)
+        return self.stats.emoticons
 
     def extract_dates(self) -> list:
         """
@@ -133,8 +392,7 @@ class TextAnalyzer:
         Returns:
             list: A list of date strings.
         """
-        pattern = re.compile(r'\b\d{1,2}[./-]\d{1,2}[./-]2007\b')
-        return pattern.findall(self.text)
+        return list(self.stats.dates)
 
     def extract_special_words(self) -> list:
         """
@@ -144,13 +402,7 @@ class TextAnalyzer:
         Returns:
             list: A list of words satisfying the condition.
         """
-        vowels = "aeiouAEIOU"
-        special_words = []
-        for word in re.findall(r'\b\w+\b', self.text):
-            if len(word) >= 3:
-                if (word[-3].lower() not in vowels) and (word[-2].lower() in vowels):
-                    special_words.append(word)
-        return special_words
+        return list(self.stats.special_words)
 
 def analyze_specific_line(line: str) -> dict:
     """
@@ -166,13 +418,8 @@ def analyze_specific_line(line: str) -> dict:
     Returns:
         dict: Dictionary with keys 'special_words', 'total_words', 'longest_word', and 'odd_words'.
     """
-    vowels = "aeiouAEIOU"
     words = re.findall(r'\b\w+\b', line)
-    special_words = []
-    for word in words:
-        if len(word) >= 3:
-            if (word[-3].lower() not in vowels) and (word[-2].lower() in vowels):
-                special_words.append(word)
+    special_words = [word for word in words if is_special_word(word)]
     
     total_words = len(words)
     if words:
@@ -189,6 +436,31 @@ def analyze_specific_line(line: str) -> dict:
         "odd_words": odd_words
     }
 
+def analyze_file_line(filename: str, line_num: int) -> tuple:
+    """
+    Fetch one line of a file through its LineIndex and analyze it with analyze_specific_line.
+
+    Only the chosen line is read, so the cost does not depend on the line number. If the
+    index cannot be built or stored next to the file (no permission, read-only file system,
+    disk full), the line is found by reading the file in chunks.
+
+    Parameters:
+        filename (str): The text file.
+        line_num (int): The 1-based line number.
+
+    Returns:
+        tuple: (line, analysis) where analysis is the result of analyze_specific_line.
+
+    Raises:
+        IndexError: If the file has fewer lines.
+    """
+    try:
+        with LineIndex(filename) as lines:
+            line = lines.line(line_num)
+    except OSError:
+        line = read_line(filename, line_num)
+    return line, analyze_specific_line(line)
+
 def save_text_to_file(filename: str, content: str):
     """
     Save the given content to the specified file.
@@ -215,23 +487,328 @@ def archive_file(zip_filename: str, file_to_archive: str):
         for fileinfo in info:
             print(f"Archived: {fileinfo.filename}, Size: {fileinfo.file_size} bytes")
 
-def analyze_text_file(source_filename: str, result_filename: str):
+def sentence_ranges(text: str, chunk_size: int) -> list:
     """
-    Read text from 'source_filename', perform text analysis, and save the results.
-    If the file contains multiple lines, the user is asked to choose one for detailed analysis.
-    The report is printed, saved to 'result_filename', and then archived.
+    Split a text into ranges of about chunk_size characters that end after a sentence break.
+
+    Every range except the last ends right after the whitespace of a sentence break, so the
+    TextStatistics of the ranges, merged in order, equal the statistics of the whole text.
+
+    Returns:
+        list: (start, end) pairs covering the text.
+    """
+    ranges = []
+    start = 0
+    while start + chunk_size < len(text):
+        match = SENTENCE_BREAK_PATTERN.search(text, start + chunk_size)
+        if match is None:
+            break
+        ranges.append((start, match.end()))
+        start = match.end()
+    if start < len(text) or not ranges:
+        ranges.append((start, len(text)))
+    return ranges
+
+def last_sentence_break(text: str) -> int:
+    """
+    Return the end of the last complete sentence break in a text, or 0 if there is none.
+    """
+    end = len(text)
+    while True:
+        i = max(text.rfind('.', 0, end), text.rfind('!', 0, end), text.rfind('?', 0, end))
+        if i < 0:
+            return 0
+        match = SENTENCE_BREAK_PATTERN.match(text, i + 1)
+        if match:
+            return match.end()
+        end = i
+
+def scan_text_parallel(text: str, workers: int = None, chunk_size: int = 1 << 20) -> TextStatistics:
+    """
+    Collect the statistics of a text with a process pool (map-reduce).
+
+    The text is split at sentence breaks (sentence_ranges), every range is scanned by
+    scan_text in a worker, and the partial statistics are merged in text order.
 
     Parameters:
-        source_filename (str): Input text file name.
-        result_filename (str): Filename to save the analysis report.
+        text (str): The text to scan.
+        workers (int): Number of worker processes (default: os.cpu_count()); 1 scans in-process.
+        chunk_size (int): Approximate number of characters per task.
+
+    Returns:
+        TextStatistics: The same statistics as scan_text(text).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or chunk_size <= 0:
+        raise ValueError("workers and chunk_size must be positive.")
+    chunks = [text[start:end] for start, end in sentence_ranges(text, chunk_size)]
+    if workers == 1 or len(chunks) == 1:
+        partials = map(scan_text, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            partials = list(pool.map(scan_text, chunks))
+    stats = TextStatistics()
+    for partial in partials:
+        stats.merge(partial)
+    return stats
+
+def scan_text_file_parallel(filename: str, workers: int = None, chunk_size: int = 4 << 20) -> tuple:
+    """
+    Collect the statistics and the line count of a text file with a process pool.
+
+    The file is read in chunks, every chunk is cut after its last sentence break and
+    scanned in a worker; at most two chunks per worker are in flight at a time.
+
+    Parameters:
+        filename (str): The name of the file to read.
+        workers (int): Number of worker processes (default: os.cpu_count()).
+        chunk_size (int): Number of characters read at a time.
+
+    Returns:
+        tuple: (stats, line_count), the same as scan_text_file.
+
+    Raises:
+        IOError: If the file cannot be opened.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or chunk_size <= 0:
+        raise ValueError("workers and chunk_size must be positive.")
+    stats = TextStatistics()
+    line_breaks = 0
+    last_char = ""
+    carry = ""
+    pending = deque()
+    with open(filename, "r", encoding="utf-8") as f, ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            line_breaks += sum(chunk.count(char) for char in LINE_BREAKS)
+            last_char = chunk[-1]
+            text = carry + chunk
+            cut = last_sentence_break(text)
+            if cut:
+                pending.append(pool.submit(scan_text, text[:cut]))
+                carry = text[cut:]
+            else:
+                carry = text
+            while len(pending) > 2 * workers:
+                stats.merge(pending.popleft().result())
+        pending.append(pool.submit(scan_text, carry))
+        while pending:
+            stats.merge(pending.popleft().result())
+    if not last_char:
+        return stats, 0
+    return stats, line_breaks + (0 if last_char in LINE_BREAKS else 1)
+
+# Version of the state files written by scan_text_file_incremental.
+ANALYSIS_STATE_VERSION = 3
+
+# Bytes at each end of the analyzed prefix that are hashed to recognise it.
+PREFIX_CHECK_BLOCK = 1 << 16
+
+# Statistics kept in the side file of the state instead of the JSON state itself.
+STATE_LIST_FIELDS = {"dates": "d", "special_words": "w"}
+
+def _count_line_breaks(text: str) -> int:
+    """
+    Count the line breaks of str.splitlines in untranslated text ("\r\n" is one break).
+    """
+    return sum(text.count(char) for char in LINE_BREAKS) - text.count("\r\n")
+
+def _prefix_digest(f, offset: int) -> str:
+    """
+    Return the SHA-256 hex digest of the first and the last PREFIX_CHECK_BLOCK bytes before offset.
+    """
+    hasher = hashlib.sha256()
+    f.seek(0)
+    hasher.update(f.read(min(offset, PREFIX_CHECK_BLOCK)))
+    tail = max(offset - PREFIX_CHECK_BLOCK, PREFIX_CHECK_BLOCK)
+    if tail < offset:
+        f.seek(tail)
+        hasher.update(f.read(offset - tail))
+    return hasher.hexdigest()
+
+def _load_analysis_state(state_filename: str):
+    """
+    Return the stored analysis state, or None if it is missing, unreadable, malformed or of another version.
     """
     try:
-        full_text = read_text_file(source_filename)
-    except IOError as e:
-        print(f"Error reading file {source_filename}: {e}")
-        return
+        with open(state_filename, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != ANALYSIS_STATE_VERSION:
+        return None
+    counters = vars(TextStatistics()).keys() - STATE_LIST_FIELDS.keys()
+    try:
+        valid = (all(isinstance(state[key], int) for key in ("offset", "line_breaks", "lists_size"))
+                 and all(isinstance(state[key], str) for key in ("digest", "last_char", "lists_token"))
+                 and isinstance(state["counters"], dict) and state["counters"].keys() == counters)
+    except KeyError:
+        return None
+    return state if valid else None
+
+def _save_analysis_state(state_filename: str, state: dict):
+    """
+    Write the analysis state as JSON through atomic_write, so a crash never leaves half a state.
+    """
+    with atomic_write(state_filename, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+
+def _load_analysis_lists(lists_filename: str, token: str, size: int):
+    """
+    Read the dates and special words stored in the first size bytes of the side file.
 
-    analyzer = TextAnalyzer(full_text)
+    Returns:
+        dict: The lists by TextStatistics field, or None if the file is missing,
+        shorter than size or belongs to another state (token).
+    """
+    try:
+        with open(lists_filename, "rb") as f:
+            data = f.read(size)
+        lines = data.decode("utf-8").split("\n")
+    except (OSError, ValueError):
+        return None
+    if len(data) != size or lines[0] != token or lines[-1] != "":
+        return None
+    lists = {field: [] for field in STATE_LIST_FIELDS}
+    fields = {kind: lists[field] for field, kind in STATE_LIST_FIELDS.items()}
+    try:
+        for line in lines[1:-1]:
+            fields[line[0]].append(line[2:])
+    except (KeyError, IndexError):
+        return None
+    return lists
+
+def _write_analysis_lists(lists_filename: str, token: str, size: int, lists: dict) -> int:
+    """
+    Append entries to the side file and return its new size.
+
+    With size 0 a new side file for token is written; otherwise anything after size
+    (the tail of an append the state never recorded) is cut off first. Dates and
+    special words contain no whitespace, so each entry is one line "<kind> <value>".
+    """
+    lines = [f"{STATE_LIST_FIELDS[field]} {value}\n" for field, values in lists.items() for value in values]
+    data = "".join(lines).encode("utf-8")
+    if not size:
+        data = f"{token}\n".encode("utf-8") + data
+        with atomic_write(lists_filename, "wb") as f:
+            f.write(data)
+        return len(data)
+    with open(lists_filename, "r+b") as f:
+        f.truncate(size)
+        f.seek(size)
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return size + len(data)
+
+def scan_text_file_incremental(filename: str, chunk_size: int = 1 << 20, state_filename: str = None) -> tuple:
+    """
+    Collect the statistics and the line count of a text file that only grows, re-scanning only the new text.
+
+    The counters up to the last complete sentence are stored as JSON in state_filename, together
+    with the byte offset of that point and a SHA-256 digest of the first and last
+    PREFIX_CHECK_BLOCK bytes before it. The dates and special words go to an append-only
+    side file (state_filename + ".lists"), so a run only writes the entries it found.
+    On the next call the stored prefix is recognised by its size and digest: if it matches,
+    only the bytes after the offset are scanned and merged into the stored statistics;
+    otherwise the file is scanned from the start. The file is assumed to change only by
+    appending; an edit in the middle of the analyzed prefix is not detected.
+
+    Parameters:
+        filename (str): The name of the file to read.
+        chunk_size (int): Number of bytes read at a time.
+        state_filename (str): Where the state is kept (default: filename + ".analysis").
+
+    Returns:
+        tuple: (stats, line_count), the same as scan_text_file.
+
+    Raises:
+        IOError: If the file cannot be opened.
+    """
+    state_filename = state_filename or filename + ".analysis"
+    lists_filename = state_filename + ".lists"
+    state = _load_analysis_state(state_filename)
+    with open(filename, "rb") as f:
+        stored_lists = None
+        if (state and 0 < state["offset"] <= os.fstat(f.fileno()).st_size
+                and _prefix_digest(f, state["offset"]) == state["digest"]):
+            stored_lists = _load_analysis_lists(lists_filename, state["lists_token"], state["lists_size"])
+        scanner = TextScanner()
+        offset = 0
+        line_breaks = 0
+        last_char = ""
+        if stored_lists is not None:
+            vars(scanner.stats).update(state["counters"], **stored_lists)
+            offset = state["offset"]
+            line_breaks = state["line_breaks"]
+            last_char = state["last_char"]
+        stored_counts = {field: len(getattr(scanner.stats, field)) for field in STATE_LIST_FIELDS}
+        f.seek(offset)
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        carry = ""
+        # Last character of the part covered by the state.
+        stored_last_char = last_char
+        while True:
+            data = f.read(chunk_size)
+            text = decoder.decode(data, final=not data)
+            if text:
+                last_char = text[-1]
+                text = carry + text
+                # Only whole sentences are added to the stored state.
+                cut = last_sentence_break(text)
+                if cut:
+                    done = text[:cut]
+                    scanner.feed(done)
+                    line_breaks += _count_line_breaks(done)
+                    offset += len(done.encode("utf-8"))
+                    stored_last_char = done[-1]
+                carry = text[cut:]
+            if not data:
+                break
+
+        if stored_lists is None or offset != state["offset"]:
+            stats = vars(scanner.stats)
+            if stored_lists is None:
+                token, size = uuid.uuid4().hex, 0
+            else:
+                token, size = state["lists_token"], state["lists_size"]
+            new_entries = {field: stats[field][stored_counts[field]:] for field in STATE_LIST_FIELDS}
+            _save_analysis_state(state_filename, {
+                "version": ANALYSIS_STATE_VERSION,
+                "offset": offset,
+                "digest": _prefix_digest(f, offset),
+                "counters": {key: value for key, value in stats.items() if key not in STATE_LIST_FIELDS},
+                "line_breaks": line_breaks,
+                "last_char": stored_last_char,
+                "lists_token": token,
+                "lists_size": _write_analysis_lists(lists_filename, token, size, new_entries),
+            })
+    # The unfinished last sentence is counted for this report only.
+    scanner.feed(carry)
+    line_breaks += _count_line_breaks(carry)
+    stats = scanner.finish()
+    if not last_char:
+        return stats, 0
+    return stats, line_breaks + (0 if last_char in LINE_BREAKS else 1)
+
+def global_report_lines(analyzer) -> list:
+    """
+    Build the global part of the analysis report.
+
+    Parameters:
+        analyzer: A TextAnalyzer or TextStatistics.
+
+    Returns:
+        list: The report lines.
+    """
+    if isinstance(analyzer, TextStatistics):
+        analyzer = TextAnalyzer("", analyzer)
     sentence_stats = analyzer.analyze_sentences()
     avg_sentence_len = analyzer.average_sentence_length()
     avg_word_len = analyzer.average_word_length()
@@ -251,29 +828,32 @@ def analyze_text_file(source_filename: str, result_filename: str):
     report_lines.append(f"Dates found (year 2007): {dates}")
     report_lines.append(f"Special words (global extraction): {special_words_global}")
     report_lines.append("")
+    return report_lines
 
-    lines = full_text.splitlines()
-    if not lines:
-        print("The source text is empty.")
-        return
-
-    if len(lines) > 1:
-        print(f"The source file contains {len(lines)} lines.")
+def choose_line_number(line_count: int) -> int:
+    """
+    Ask the user for the line to analyze in detail (1-based); a single line is chosen automatically.
+    """
+    if line_count > 1:
+        print(f"The source file contains {line_count} lines.")
         while True:
             try:
-                line_num = int(input(f"Enter the line number (1 - {len(lines)}) to analyze further: "))
-                if 1 <= line_num <= len(lines):
-                    chosen_line = lines[line_num - 1]
-                    break
+                line_num = int(input(f"Enter the line number (1 - {line_count}) to analyze further: "))
+                if 1 <= line_num <= line_count:
+                    return line_num
                 else:
                     print("Invalid line number. Try again.")
             except ValueError:
                 print("Please enter a valid integer.")
-    else:
-        chosen_line = lines[0]
-        print("The source file contains only one line.")
+    print("The source file contains only one line.")
+    return 1
 
-    line_analysis = analyze_specific_line(chosen_line)
+def finish_report(report_lines: list, chosen_line: str, result_filename: str, line_analysis: dict = None):
+    """
+    Add the analysis of the chosen line to the report, then print, save and archive it.
+    """
+    if line_analysis is None:
+        line_analysis = analyze_specific_line(chosen_line)
     report_lines.append("=== Detailed Analysis for the Chosen Line ===")
     report_lines.append(f"Chosen line: {chosen_line}")
     report_lines.append(f"Total number of words: {line_analysis['total_words']}")
@@ -290,6 +870,63 @@ def analyze_text_file(source_filename: str, result_filename: str):
     zip_filename = result_filename.rsplit('.', 1)[0] + ".zip"
     archive_file(zip_filename, result_filename)
 
+def analyze_text_file(source_filename: str, result_filename: str):
+    """
+    Read text from 'source_filename', perform text analysis, and save the results.
+    If the file contains multiple lines, the user is asked to choose one for detailed analysis.
+    The report is printed, saved to 'result_filename', and then archived.
+
+    Parameters:
+        source_filename (str): Input text file name.
+        result_filename (str): Filename to save the analysis report.
+    """
+    try:
+        full_text = read_text_file(source_filename)
+    except IOError as e:
+        print(f"Error reading file {source_filename}: {e}")
+        return
+
+    report_lines = global_report_lines(TextAnalyzer(full_text))
+
+    lines = full_text.splitlines()
+    if not lines:
+        print("The source text is empty.")
+        return
+
+    chosen_line = lines[choose_line_number(len(lines)) - 1]
+    finish_report(report_lines, chosen_line, result_filename)
+
+def analyze_text_file_streaming(source_filename: str, result_filename: str, chunk_size: int = 1 << 20,
+                                incremental: bool = False):
+    """
+    Produce the same report as analyze_text_file while reading the source in chunks,
+    so that memory use does not grow with the file size.
+
+    Parameters:
+        source_filename (str): Input text file name.
+        result_filename (str): Filename to save the analysis report.
+        chunk_size (int): Number of characters read at a time.
+        incremental (bool): Keep the analysis state next to the source and only scan
+            text appended since the previous run (see scan_text_file_incremental).
+    """
+    try:
+        if incremental:
+            stats, line_count = scan_text_file_incremental(source_filename, chunk_size)
+        else:
+            stats, line_count = scan_text_file(source_filename, chunk_size)
+    except IOError as e:
+        print(f"Error reading file {source_filename}: {e}")
+        return
+
+    report_lines = global_report_lines(stats)
+
+    if not line_count:
+        print("The source text is empty.")
+        return
+
+    chosen_line, line_analysis = analyze_file_line(source_filename, choose_line_number(line_count))
+    finish_report(report_lines, chosen_line, result_filename, line_analysis)
+
 if __name__ == "__main__":
     source_file = input("Enter the source text file name: ").strip()
     result_file = "text_analysis_report.txt"
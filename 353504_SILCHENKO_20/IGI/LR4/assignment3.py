@@ -12,10 +12,12 @@ Purpose:
     and the exact value becomes less than the specified precision (eps) or when
     the number of terms reaches 500.
     
-    The program outputs a table (with one row) showing:
+    The program outputs a table (one row for plain and one for accelerated summation) showing:
       x | n | F(x) (Series) | Math F(x) | eps
       
-    It then calculates additional statistical parameters for the single computed value.
+    It then calculates additional statistical parameters for the computed value. compute_statistics
+    also accepts arrays or iterables of many results and uses mergeable streaming accumulators
+    (Welford moments and a quantile sketch).
     
     Finally, it uses matplotlib to plot two continuous graphs on the same axes:
       - The exact function f(x)=1/(1-x) calculated using math.
@@ -24,6 +26,12 @@ Purpose:
         
     This graph is drawn over an interval (e.g. from -0.9 to 0.9), includes axes labels, legend, grid, annotations,
     and is saved to a file.
+
+    For parameter sweeps, compute_series_batch evaluates the series for whole NumPy arrays
+    of x and eps at once; compute_series_with_precision sums a single point in plain Python,
+    which avoids the array overhead.
+    With accelerate=True the partial sums are passed through the Wynn epsilon algorithm,
+    which reaches eps in far fewer terms for |x| close to 1. The result table shows both.
 """
 
 import math
@@ -31,6 +39,226 @@ import statistics
 import matplotlib.pyplot as plt
 import numpy as np
 
+from series_acceleration import wynn_accelerate
+
+class RunningStats:
+    """
+    Mergeable running mean and variance (Welford's algorithm).
+
+    Chunks are folded in with the parallel update of Chan et al., so partial
+    accumulators built by different workers can be merged without the values.
+
+    Attributes:
+        count (int): Number of values seen.
+        mean (float): Running mean.
+        m2 (float): Sum of squared deviations from the mean.
+        minimum (float): Smallest value seen.
+        maximum (float): Largest value seen.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def update(self, values):
+        """
+        Add a 1D array of values.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        self._combine(values.size, chunk_mean, chunk_m2, float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        """
+        Fold another RunningStats into this one.
+        """
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        """Merge the moments of a chunk or another accumulator."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 for fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative accuracy (DDSketch layout).
+
+    Values are counted in logarithmic buckets of ratio gamma = (1 + alpha) / (1 - alpha),
+    separately for positive and negative values, so every quantile estimate is within a
+    relative error alpha of a true value. Memory depends on the range of the values,
+    not on their number, and two sketches with the same alpha merge by adding counts.
+    """
+    # Magnitudes below this are counted as zero.
+    MIN_MAGNITUDE = 1e-300
+
+    def __init__(self, alpha: float = 0.01):
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1.")
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def update(self, values):
+        """
+        Add a 1D array of values.
+        """
+        values = np.asarray(values, dtype=float)
+        magnitudes = np.abs(values)
+        small = magnitudes < self.MIN_MAGNITUDE
+        self.zero_count += int(small.sum())
+        self.count += values.size
+        for store, mask in ((self.positive, (values > 0) & ~small), (self.negative, (values < 0) & ~small)):
+            if mask.any():
+                keys = np.ceil(np.log(magnitudes[mask]) / self._log_gamma).astype(np.int64)
+                for key, key_count in zip(*np.unique(keys, return_counts=True)):
+                    store[int(key)] = store.get(int(key), 0) + int(key_count)
+
+    def merge(self, other):
+        """
+        Fold another sketch with the same alpha into this one.
+        """
+        if other.alpha != self.alpha:
+            raise ValueError("Only sketches with the same alpha can be merged.")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, key_count in other_store.items():
+                store[key] = store.get(key, 0) + key_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _bucket_value(self, key: int) -> float:
+        """Representative magnitude of a bucket."""
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """
+        Return the approximate q-quantile (0 <= q <= 1), or nan for an empty sketch.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self.positive)) if self.positive else 0.0
+
+    def mode(self) -> float:
+        """
+        Return the representative value of the most populated bucket, or nan for an empty sketch.
+        """
+        candidates = [(self.zero_count, 0.0)]
+        candidates += [(c, self._bucket_value(k)) for k, c in self.positive.items()]
+        candidates += [(c, -self._bucket_value(k)) for k, c in self.negative.items()]
+        best_count, best_value = max(candidates, key=lambda item: item[0])
+        return best_value if best_count else math.nan
+
+class StreamingStatistics:
+    """
+    Single-pass, mergeable statistics over series values.
+
+    Combines RunningStats (mean, variance, min, max) and QuantileSketch
+    (median, quantiles, approximate mode). NaN values are skipped.
+    """
+    def __init__(self, alpha: float = 0.01):
+        self.moments = RunningStats()
+        self.sketch = QuantileSketch(alpha)
+
+    def update(self, values):
+        """
+        Add a 1D array of values.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        self.moments.update(values)
+        self.sketch.update(values)
+
+    def merge(self, other):
+        """
+        Fold the statistics of another StreamingStatistics (e.g. from a worker) into this one.
+        """
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def result(self, quantiles=(0.25, 0.5, 0.75)) -> dict:
+        """
+        Return the statistics as a dictionary with the keys
+        'count', 'mean', 'median', 'mode', 'variance', 'stdev', 'min', 'max' and 'quantiles'.
+        The median, quantiles and mode are approximate and clamped to [min, max].
+        """
+        moments = self.moments
+        if not moments.count:
+            nan = math.nan
+            return {'count': 0, 'mean': nan, 'median': nan, 'mode': nan, 'variance': nan,
+                    'stdev': nan, 'min': nan, 'max': nan, 'quantiles': {q: nan for q in quantiles}}
+
+        def clamp(value):
+            return min(max(value, moments.minimum), moments.maximum)
+
+        return {
+            'count': moments.count,
+            'mean': moments.mean,
+            'median': clamp(self.sketch.quantile(0.5)),
+            'mode': clamp(self.sketch.mode()),
+            'variance': moments.variance,
+            'stdev': math.sqrt(moments.variance),
+            'min': moments.minimum,
+            'max': moments.maximum,
+            'quantiles': {q: clamp(self.sketch.quantile(q)) for q in quantiles},
+        }
+
+def _series_values(results, chunk_size):
+    """
+    Yield 1D float arrays of series values from results in chunks of at most chunk_size.
+
+    Accepted results: a numeric array, a record array with a 'series_sum' field
+    (e.g. from series_sweep.run_sweep), or an iterable of numbers or of result
+    dictionaries with an 'F_series' key.
+    """
+    if isinstance(results, np.ndarray):
+        if results.dtype.names:
+            results = results['series_sum']
+        flat = results.ravel()
+        for start in range(0, flat.size, chunk_size):
+            yield flat[start:start + chunk_size]
+        return
+    buffer = []
+    for item in results:
+        buffer.append(item['F_series'] if isinstance(item, dict) else item)
+        if len(buffer) == chunk_size:
+            yield np.asarray(buffer, dtype=float)
+            buffer.clear()
+    if buffer:
+        yield np.asarray(buffer, dtype=float)
+
 class SeriesAnalyzer:
     def __init__(self, result):
         """
@@ -43,24 +271,34 @@ class SeriesAnalyzer:
         """
         self.result = result
 
-    def compute_statistics(self):
+    def compute_statistics(self, results=None, quantiles=(0.25, 0.5, 0.75), chunk_size=65536):
         """
-        Since only one computed value is available, statistics are trivial.
-        Returns a dictionary containing:
-            'mean', 'median', 'mode', 'variance', 'stdev'
-        For a single number, they all equal that number (or 0 for variance and stdev).
+        Compute statistics of series values in a single streaming pass.
+
+        Values are processed in chunks of chunk_size, so an iterable of any length
+        is handled in constant memory. Mean, variance, stdev, min and max are exact
+        (variance is the sample variance, 0.0 for a single value); the median,
+        quantiles and mode come from a quantile sketch with 1% relative accuracy.
+        Use StreamingStatistics directly to merge partial results from workers.
+
+        Parameters:
+            results: Series results (see _series_values). Defaults to the single
+                result this analyzer was created with.
+            quantiles (tuple): Quantile levels to report.
+            chunk_size (int): Number of values processed at once.
+
+        Returns:
+            dict: Keys 'count', 'mean', 'median', 'mode', 'variance', 'stdev',
+            'min', 'max' and 'quantiles' (a dictionary from level to value).
         """
-        value = self.result['F_series']
-        stats = {
-            'mean': value,
-            'median': value,
-            'mode': value,
-            'variance': 0.0,
-            'stdev': 0.0
-        }
-        return stats
+        if results is None:
+            results = [self.result]
+        accumulator = StreamingStatistics()
+        for values in _series_values(results, chunk_size):
+            accumulator.update(values)
+        return accumulator.result(quantiles)
 
-    def plot_results(self, n_terms, save_filename="series_plot.png"):
+    def plot_results(self, n_terms, save_filename="series_plot.png", points=300):
         """
         Plot the exact function and the series approximation (with fixed n_terms) over an interval.
         
@@ -70,47 +308,180 @@ class SeriesAnalyzer:
         
         A continuous curve for f(x) is plotted using math,
         and the series approximation is plotted using the computed number of terms.
+        All curves are evaluated at once with series_curve.
         
         Parameters:
-            n_terms (int): Number of terms to use in the series approximation function.
+            n_terms (int or sequence of int): Number(s) of terms to use in the series approximation;
+                one curve is drawn per value and the annotations follow the first one.
             save_filename (str): Filename for saving the resulting plot.
+            points (int): Number of points per curve.
         """
+        n_list = np.atleast_1d(n_terms)
         # Define a plotting interval where |x| < 1. Here we take from -0.9 to 0.9.
-        x_values = np.linspace(-0.9, 0.9, 300)
-        y_exact = [1 / (1 - t) for t in x_values]
-        # Define the series approximation with fixed n_terms:
-        def series_approx(t):
-            s = sum([t ** i for i in range(n_terms)])
-            return s
-        y_series = [series_approx(t) for t in x_values]
+        x_values = np.linspace(-0.9, 0.9, points)
+        y_exact = 1 / (1 - x_values)
+        y_series = series_curve(x_values, n_list)
         
         plt.figure(figsize=(10, 6))
         plt.plot(x_values, y_exact, 'r-', label="Exact Calculation (math)")
-        plt.plot(x_values, y_series, 'b--', label=f"Series Approximation (n={n_terms})")
+        for n, y in zip(n_list, y_series):
+            plt.plot(x_values, y, '--', label=f"Series Approximation (n={n})")
         plt.xlabel("x")
         plt.ylabel("F(x)")
         plt.title("Exact Function vs Series Approximation for f(x)=1/(1-x)")
         plt.legend()
         plt.grid(True)
         # Optionally annotate a few sample points:
-        for t in np.linspace(-0.8, 0.8, 5):
-            plt.annotate(f"{series_approx(t):.2f}", (t, series_approx(t)), textcoords="offset points", xytext=(0, 8), ha="center")
+        t_values = np.linspace(-0.8, 0.8, 5)
+        for t, y in zip(t_values, series_curve(t_values, n_list[0])):
+            plt.annotate(f"{y:.2f}", (t, y), textcoords="offset points", xytext=(0, 8), ha="center")
         plt.savefig(save_filename)
         plt.show()
 
-def compute_series_with_precision(x, eps, max_iter=500):
+def series_curve(x_values, n_terms):
+    """
+    Evaluate the partial sums Sₙ(x) = sum_{i=0}^{n-1} x^i for whole arrays at once.
+
+    Uses the closed form Sₙ(x) = (1 - xⁿ) / (1 - x), with Sₙ(1) = n, so the cost does not
+    depend on the number of terms.
+
+    Parameters:
+        x_values (array_like): Points at which to evaluate the partial sums.
+        n_terms (int or array_like of int): Number(s) of terms.
+
+    Returns:
+        np.ndarray: Values of shape x.shape for a scalar n_terms, otherwise
+        (len(n_terms),) + x.shape with one row per number of terms.
+    """
+    x = np.asarray(x_values, dtype=float)
+    n = np.asarray(n_terms)
+    n_grid = n.reshape(n.shape + (1,) * x.ndim)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        values = (1 - x ** n_grid) / (1 - x)
+    return np.where(x == 1, n_grid.astype(float), values)
+
+def compute_series_batch(x, eps, max_iter=500):
+    """
+    Vectorized power series evaluation of f(x)=1/(1-x) for arrays of x and eps.
+
+    Each element is summed with the same rule as compute_series_with_precision:
+    starting from the first term 1, further terms are added until
+    |F_series - F_exact| < eps or the number of terms reaches max_iter.
+    Converged elements leave the working set, so later iterations only
+    process the points that still need more terms.
+
+    Parameters:
+        x (array_like): Input values (|x| < 1).
+        eps (array_like): Desired precisions, broadcast against x.
+        max_iter (int): Maximum number of terms (default is 500).
+
+    Returns:
+        tuple: (n, F_series, F_exact, error) arrays with the broadcast shape of x and eps.
+
+    Raises:
+        ZeroDivisionError: If any x equals 1.
+    """
+    if np.ndim(x) == 0 and np.ndim(eps) == 0:
+        # A single point: plain Python avoids the array setup.
+        F_series, n = _sum_series(float(x), float(eps), max_iter)
+        F_exact = 1 / (1 - float(x))
+        return (np.asarray(n), np.asarray(F_series), np.asarray(F_exact), np.asarray(abs(F_series - F_exact)))
+
+    x, eps = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(eps, dtype=float))
+    shape = x.shape
+    x = x.ravel()
+    eps = eps.ravel()
+    if np.any(x == 1):
+        raise ZeroDivisionError("f(x)=1/(1-x) is undefined at x = 1.")
+
+    F_exact = 1 / (1 - x)
+    series_sum = np.ones_like(x)  # First term (x^0 = 1)
+    n = np.ones(x.shape, dtype=int)
+
+    active = np.arange(x.size)
+    x_act, eps_act, exact_act = x, eps, F_exact
+    term_act = np.ones_like(x)
+    sum_act = np.ones_like(x)
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(1, max_iter):
+            if active.size == 0:
+                break
+            term_act *= x_act
+            sum_act += term_act
+            done = np.abs(sum_act - exact_act) < eps_act
+            if i + 1 == max_iter:
+                done[:] = True
+            if done.any():
+                finished = active[done]
+                series_sum[finished] = sum_act[done]
+                n[finished] = i + 1
+                keep = ~done
+                active = active[keep]
+                x_act, eps_act, exact_act = x_act[keep], eps_act[keep], exact_act[keep]
+                term_act, sum_act = term_act[keep], sum_act[keep]
+        error = np.abs(series_sum - F_exact)
+
+    return (n.reshape(shape), series_sum.reshape(shape),
+            F_exact.reshape(shape), error.reshape(shape))
+
+def _partial_sums(x, max_iter):
+    """
+    Yield the partial sums 1, 1 + x, 1 + x + x^2, ... (at most max_iter of them).
+    """
+    series_sum = 1.0  # First term (x^0 = 1)
+    term = 1.0
+    yield series_sum
+    for i in range(1, max_iter):
+        term *= x
+        series_sum += term
+        yield series_sum
+
+def compute_series_accelerated(x, eps, max_iter=500):
+    """
+    Compute f(x)=1/(1-x) from its power series using Wynn epsilon acceleration.
+
+    Partial sums are fed into the epsilon table term by term (see
+    series_acceleration.wynn_accelerate), and the summation stops when the accelerated
+    estimate satisfies |F_accel - F_exact| < eps. For |x| close to 1 this needs only a
+    few terms where plain summation would exhaust max_iter. If eps is not reached within
+    max_iter terms, the most stable estimate is returned rather than the last one.
+
+    Parameters:
+        x (float): Input value (|x| < 1).
+        eps (float): Desired precision.
+        max_iter (int): Maximum number of terms (default is 500).
+
+    Returns:
+        tuple: (F_accel, n) where F_accel is the accelerated value and n is the number of terms used.
+    """
+    F_exact = 1 / (1 - x)
+    n, estimate = wynn_accelerate(_partial_sums(x, max_iter),
+                                  lambda value: abs(value - F_exact) < eps)
+    return estimate, n
+
+def compute_series_with_precision(x, eps, max_iter=500, accelerate=False):
     """
     Compute the power series expansion for f(x)=1/(1-x) with a given accuracy (eps).
     The summation stops when |F_series - F_exact| < eps or when the number of terms reaches max_iter.
+    A single point is summed in plain Python; compute_series_batch applies the same rule to arrays.
     
     Parameters:
         x (float): Input value (|x| < 1).
         eps (float): Desired precision.
         max_iter (int): Maximum number of terms (default is 500).
+        accelerate (bool): Use Wynn epsilon acceleration (see compute_series_accelerated).
     
     Returns:
         tuple: (F_series, n) where F_series is the computed series value and n is the number of terms used.
     """
+    if accelerate:
+        return compute_series_accelerated(x, eps, max_iter)
+    return _sum_series(x, eps, max_iter)
+
+def _sum_series(x, eps, max_iter):
+    """
+    Sum the series for one point in plain Python; returns (F_series, n).
+    """
     F_exact = 1 / (1 - x)
     series_sum = 1.0  # First term (x^0 = 1)
     term = 1.0
@@ -128,7 +499,7 @@ def run_analysis():
     Main function that:
       1. Reads a single value of x (|x| < 1) and the desired precision (eps).
       2. Computes f(x) using the power series expansion (with precision control) and using math.
-      3. Outputs a table showing: x, n, F(x) (Series), Math F(x), eps.
+      3. Outputs a table showing: x, n, F(x) (Series), Math F(x), eps for plain and accelerated summation.
       4. Computes and prints basic statistical parameters (for the one computed value).
       5. Plots two continuous graphs over an interval:
            - The exact function f(x)=1/(1-x) (using math)
@@ -150,14 +521,16 @@ def run_analysis():
         except ValueError:
             print("Invalid input. Please enter numeric values.")
     
-    # Compute series value and number of terms
+    # Compute series value and number of terms, plain and accelerated
     F_series, n_terms = compute_series_with_precision(x, eps)
+    F_accel, n_accel = compute_series_with_precision(x, eps, accelerate=True)
     F_math = 1 / (1 - x)
     
-    # Print a results table (only one row)
-    print("\n|     x     |    n    |   F(x) (Series)   |   Math F(x)   |   eps   |")
-    print("|-----------|---------|-------------------|---------------|---------|")
-    print(f"| {x:^9.5f} | {n_terms:^7d} | {F_series:^17.6f} | {F_math:^13.6f} | {eps:^7.5f} |")
+    # Print a results table (plain summation and Wynn epsilon acceleration)
+    print("\n|     x     |    n    |   F(x) (Series)   |   Math F(x)   |   eps   |   method    |")
+    print("|-----------|---------|-------------------|---------------|---------|-------------|")
+    print(f"| {x:^9.5f} | {n_terms:^7d} | {F_series:^17.6f} | {F_math:^13.6f} | {eps:^7.5f} | {'plain':^11} |")
+    print(f"| {x:^9.5f} | {n_accel:^7d} | {F_accel:^17.6f} | {F_math:^13.6f} | {eps:^7.5f} | {'accelerated':^11} |")
     
     # Create a result dictionary for statistics and further plotting.
     result = {
@@ -90,7 +90,8 @@ class Rectangle(GeometricFigure):
         """
         return cls.name
 
-def draw_rectangle(rect: Rectangle, annotation: str = "", save_filename: str = "rectangle.png"):
+def draw_rectangle(rect: Rectangle, annotation: str = "", save_filename: str = "rectangle.png",
+                   interactive: bool = True):
     """
     Draw the rectangle using matplotlib, fill it with its color, annotate it with the provided text,
     and save the image.
@@ -99,6 +100,7 @@ def draw_rectangle(rect: Rectangle, annotation: str = "", save_filename: str = "
         rect (Rectangle): The rectangle object to draw.
         annotation (str): Text to annotate on the figure.
         save_filename (str): Filename for saving the image.
+        interactive (bool): Show the figure and report the file; otherwise only save and close it.
     """
     fig, ax = plt.subplots()
     patch = patches.Rectangle((0, 0), rect.width, rect.height, edgecolor='black', facecolor=rect.color_obj.color)
@@ -109,20 +111,24 @@ def draw_rectangle(rect: Rectangle, annotation: str = "", save_filename: str = "
     ax.set_ylim(-1, rect.height + 1)
     ax.set_aspect('equal')
     
-    plt.title(str(rect))
+    ax.set_title(str(rect))
     
     # If annotation text is provided, show it at the center of the rectangle.
     if annotation:
         mid_x = rect.width / 2
         mid_y = rect.height / 2
-        plt.text(mid_x, mid_y, annotation, fontsize=12, color='black',
+        ax.text(mid_x, mid_y, annotation, fontsize=12, color='black',
                  ha="center", va="center", bbox=dict(facecolor='white', alpha=0.6, edgecolor='none'))
     
-    plt.savefig(save_filename)
+    fig.savefig(save_filename)
+    if not interactive:
+        plt.close(fig)
+        return
     plt.show()
     print(f"Rectangle saved as {save_filename}")
 
-def draw_parallelogram(a: float, b: float, angle_deg: float, color: str = "green", annotation: str = "", save_filename: str = "parallelogram.png"):
+def draw_parallelogram(a: float, b: float, angle_deg: float, color: str = "green", annotation: str = "", save_filename: str = "parallelogram.png",
+                       interactive: bool = True):
     """
     Draw a parallelogram given sides a, b and the angle (in degrees) between them.
     The drawn figure is annotated with the provided text.
@@ -134,6 +140,7 @@ def draw_parallelogram(a: float, b: float, angle_deg: float, color: str = "green
         color (str): Color for the parallelogram.
         annotation (str): Text annotation to display on the figure.
         save_filename (str): Filename for saving the image.
+        interactive (bool): Show the figure and report the file; otherwise only save and close it.
     """
     angle_rad = math.radians(angle_deg)
     # Calculate vertices, starting from (0, 0)
@@ -153,16 +160,19 @@ def draw_parallelogram(a: float, b: float, angle_deg: float, color: str = "green
     ax.set_ylim(min(ys)-1, max(ys)+1)
     ax.set_aspect('equal')
     
-    plt.title(f"Parallelogram: a={a}, b={b}, angle={angle_deg}°")
+    ax.set_title(f"Parallelogram: a={a}, b={b}, angle={angle_deg}°")
     
     # Compute the centroid to position the annotation.
     centroid_x = sum(xs) / 4
     centroid_y = sum(ys) / 4
     if annotation:
-        plt.text(centroid_x, centroid_y, annotation, fontsize=12, color='black',
+        ax.text(centroid_x, centroid_y, annotation, fontsize=12, color='black',
                  ha="center", va="center", bbox=dict(facecolor='white', alpha=0.6, edgecolor='none'))
     
-    plt.savefig(save_filename)
+    fig.savefig(save_filename)
+    if not interactive:
+        plt.close(fig)
+        return
     plt.show()
     print(f"Parallelogram saved as {save_filename}")
 
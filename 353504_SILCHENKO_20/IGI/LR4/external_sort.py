@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Program: External Merge Sort for Student Records
+Lab Number: Lab #4, Task 1 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Sorts student datasets that do not fit in memory. Records are read as a stream, collected
+    into runs whose estimated size stays within a memory budget, and every run is sorted and
+    spilled to a temporary file. The runs are then combined with a k-way heap merge
+    (heapq.merge), in several passes if there are more runs than max_fan_in, and the result
+    is written through any StudentSerializer. CSV and SQLite destinations take the merged
+    records as a stream; the pickle and binary formats (STREAMING_SAVE = False) collect
+    the whole output before writing, so for them the final save needs O(n) memory.
+
+    Any combination of the fields surname, street, house and apartment can be used as the
+    sort key. The sort is stable, so sorting by ("surname",) gives the same order as
+    sorted() with Student.__lt__.
+"""
+
+import heapq
+import os
+import pickle
+import sys
+import tempfile
+from operator import itemgetter
+
+from assignment1 import Student
+
+FIELDS = ("surname", "street", "house", "apartment")
+
+# Records per pickled block in a run file.
+BLOCK_RECORDS = 1024
+
+
+def _record_size(record: tuple) -> int:
+    """
+    Estimate the memory taken by one record tuple in bytes.
+    """
+    return sys.getsizeof(record) + sum(sys.getsizeof(field) for field in record) + 8
+
+
+def _iter_source(source):
+    """
+    Yield students from a serializer (streamed through iter_load when available) or an iterable.
+    """
+    if hasattr(source, "iter_load"):
+        return source.iter_load()
+    if hasattr(source, "load"):
+        return iter(source.load())
+    return iter(source)
+
+
+def _write_run(records: list, directory: str) -> str:
+    """
+    Write sorted records to a new run file in blocks and return its path.
+    """
+    fd, path = tempfile.mkstemp(dir=directory, prefix="run_", suffix=".pkl")
+    with open(fd, "wb") as run:
+        for start in range(0, len(records), BLOCK_RECORDS):
+            pickle.dump(records[start:start + BLOCK_RECORDS], run, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str):
+    """
+    Lazily yield the records of a run file, one block in memory at a time.
+    """
+    with open(path, "rb") as run:
+        while True:
+            try:
+                block = pickle.load(run)
+            except EOFError:
+                return
+            yield from block
+
+
+def _merge_runs(paths: list, key, reverse: bool, directory: str, max_fan_in: int) -> list:
+    """
+    Merge groups of runs until at most max_fan_in remain, and return the remaining run paths.
+    """
+    while len(paths) > max_fan_in:
+        merged = []
+        for start in range(0, len(paths), max_fan_in):
+            group = paths[start:start + max_fan_in]
+            fd, path = tempfile.mkstemp(dir=directory, prefix="run_", suffix=".pkl")
+            with open(fd, "wb") as run:
+                block = []
+                for record in heapq.merge(*(_read_run(p) for p in group), key=key, reverse=reverse):
+                    block.append(record)
+                    if len(block) == BLOCK_RECORDS:
+                        pickle.dump(block, run, pickle.HIGHEST_PROTOCOL)
+                        block = []
+                if block:
+                    pickle.dump(block, run, pickle.HIGHEST_PROTOCOL)
+            for p in group:
+                os.unlink(p)
+            merged.append(path)
+        paths = merged
+    return paths
+
+
+def external_sort(source, destination, keys=("surname",), memory_budget: int = 64 << 20,
+                  reverse: bool = False, max_fan_in: int = 64, temp_dir: str = None) -> int:
+    """
+    Sort student records with bounded memory and save them through a serializer.
+
+    Parameters:
+        source: A StudentSerializer or an iterable of Student objects.
+        destination: The StudentSerializer used to write the sorted records. Unless its
+            STREAMING_SAVE is true, the save holds the whole sorted output in memory.
+        keys (tuple): Field names to sort by, most significant first.
+        memory_budget (int): Approximate bytes of records held in memory per run.
+        reverse (bool): Sort in descending order.
+        max_fan_in (int): Maximum number of runs merged at once.
+        temp_dir (str): Directory for run files (default: the system temporary directory).
+
+    Returns:
+        int: The number of sorted records.
+
+    Raises:
+        ValueError: If a key is not a student field or the limits are not positive.
+    """
+    if not keys or any(name not in FIELDS for name in keys):
+        raise ValueError(f"keys must be a non-empty combination of {FIELDS}.")
+    if memory_budget <= 0 or max_fan_in < 2:
+        raise ValueError("memory_budget must be positive and max_fan_in at least 2.")
+    key = itemgetter(*(FIELDS.index(name) for name in keys))
+
+    with tempfile.TemporaryDirectory(prefix="student_sort_", dir=temp_dir) as directory:
+        runs = []
+        records = []
+        used = 0
+        count = 0
+        for student in _iter_source(source):
+            record = (student.surname, student.street, student.house, student.apartment)
+            records.append(record)
+            used += _record_size(record)
+            count += 1
+            if used >= memory_budget:
+                records.sort(key=key, reverse=reverse)
+                runs.append(_write_run(records, directory))
+                records = []
+                used = 0
+
+        records.sort(key=key, reverse=reverse)
+        if runs:
+            if records:
+                runs.append(_write_run(records, directory))
+            runs = _merge_runs(runs, key, reverse, directory, max_fan_in)
+            merged = heapq.merge(*(_read_run(path) for path in runs), key=key, reverse=reverse)
+        else:
+            merged = iter(records)
+        destination.save(Student(*record) for record in merged)
+    return count
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Program: Persistent Line Offset Index for Text Files
+Lab Number: Lab #4, Task 2 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Provides LineIndex, which fetches any line of a UTF-8 text file in O(1) through mmap.
+    The byte offsets of all line starts are found once and stored next to the file
+    (filename + ".lines"), together with the size and modification time of the file;
+    the index is rebuilt automatically when either of them changes.
+
+    Lines are split exactly like str.splitlines() on the text read by read_text_file
+    (universal newlines: "\r\n" and "\r" end a line like "\n").
+
+Index file layout (little-endian):
+    header: magic b"LINEIDX1", source size (uint64), source mtime in ns (int64), line count (uint64)
+    body:   one uint64 byte offset per line start
+"""
+
+import mmap
+import os
+import re
+import struct
+from array import array
+
+INDEX_MAGIC = b"LINEIDX1"
+INDEX_HEADER = struct.Struct("<8sQqQ")
+OFFSET = struct.Struct("<Q")
+
+# Line breaks of str.splitlines in UTF-8; "\r\n" is one break.
+LINE_BREAK_BYTES = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+# Offsets collected before they are written to the index file.
+WRITE_BATCH = 1 << 16
+
+
+class LineIndex:
+    """
+    Random access to the lines of a text file through a persistent offset index.
+
+    Use as a context manager, or call close() when done:
+
+        with LineIndex("big.txt") as lines:
+            line = lines.line(10_000_000)
+    """
+
+    def __init__(self, filename: str, index_filename: str = None):
+        self.filename = filename
+        self.index_filename = index_filename or filename + ".lines"
+        stat = os.stat(filename)
+        self.size = stat.st_size
+        if not self._is_current(stat):
+            self.build(stat)
+        self._index_file = open(self.index_filename, "rb")
+        self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, self.count = INDEX_HEADER.unpack_from(self._index)
+        self._source_file = open(filename, "rb")
+        self._source = (mmap.mmap(self._source_file.fileno(), 0, access=mmap.ACCESS_READ)
+                        if self.size else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Release the memory maps and close both files.
+        """
+        for resource in (self._index, self._index_file, self._source, self._source_file):
+            if hasattr(resource, "close"):
+                resource.close()
+
+    def _is_current(self, stat) -> bool:
+        """
+        Check whether the stored index belongs to the file in its current size and mtime.
+        """
+        try:
+            with open(self.index_filename, "rb") as f:
+                header = f.read(INDEX_HEADER.size)
+        except OSError:
+            return False
+        if len(header) < INDEX_HEADER.size:
+            return False
+        magic, size, mtime_ns, count = INDEX_HEADER.unpack(header)
+        if magic != INDEX_MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns:
+            return False
+        return os.path.getsize(self.index_filename) == INDEX_HEADER.size + count * OFFSET.size
+
+    def build(self, stat=None):
+        """
+        Scan the file for line breaks and (re)write the index file.
+        """
+        stat = stat or os.stat(self.filename)
+        temp_filename = f"{self.index_filename}.{os.getpid()}.tmp"
+        count = 0
+        try:
+            with open(temp_filename, "wb") as out:
+                out.write(INDEX_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, 0))
+                offsets = array("Q")
+                # Start of the current line; it is stored once a break ends the line or text follows it.
+                line_start = 0
+                if stat.st_size:
+                    with open(self.filename, "rb") as source, \
+                            mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        for match in LINE_BREAK_BYTES.finditer(data):
+                            offsets.append(line_start)
+                            line_start = match.end()
+                            if len(offsets) >= WRITE_BATCH:
+                                offsets.tofile(out)
+                                count += len(offsets)
+                                offsets = array("Q")
+                # A break at the very end does not start another line.
+                if line_start < stat.st_size:
+                    offsets.append(line_start)
+                offsets.tofile(out)
+                count += len(offsets)
+                out.seek(0)
+                out.write(INDEX_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, count))
+            os.replace(temp_filename, self.index_filename)
+        except BaseException:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+            raise
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Return the line with the given 0-based index, without its line break.
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(f"{self.filename} has no line {index + 1}.")
+        position = INDEX_HEADER.size + index * OFFSET.size
+        start = OFFSET.unpack_from(self._index, position)[0]
+        end = OFFSET.unpack_from(self._index, position + OFFSET.size)[0] if index + 1 < self.count else self.size
+        line = self._source[start:end].decode("utf-8")
+        if line.endswith("\r\n"):
+            return line[:-2]
+        if line and LINE_BREAK_BYTES.fullmatch(line[-1].encode("utf-8")):
+            return line[:-1]
+        return line
+
+    def line(self, line_num: int) -> str:
+        """
+        Return a line by its 1-based number, as in analyze_text_file.
+        """
+        if line_num < 1:
+            raise IndexError(f"{self.filename} has no line {line_num}.")
+        return self[line_num - 1]
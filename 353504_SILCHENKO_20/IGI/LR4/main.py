@@ -11,8 +11,20 @@ Purpose:
     It imports and integrates functions from assignment1.py, assignment2.py, assignment3.py,
     assignment4.py, and assignment5.py, allowing the user to select which assignment demo to run.
     In particular, for Assignment 2 the text is read from a source file.
+
+    Batch mode:
+        python main.py --batch jobs.json --output results.jsonl
+    runs every job from a JSON or CSV job file without prompts and writes one JSON result
+    per line. Each job names its assignment number and parameters (see run_job); every
+    assignment module is imported once and reused for all of its jobs.
 """
 
+import argparse
+import csv
+import importlib
+import json
+import math
+import os
 import sys
 
 def main_menu() -> int:
@@ -70,6 +82,8 @@ def run_assignment(choice: int):
         
         if source_choice == 'csv':
             loaded_students = csv_serializer.load()
+            if csv_serializer.bad_rows:
+                print(f"\nSkipped {csv_serializer.bad_rows} bad rows: {csv_serializer.error_counts}")
             print("\nStudents loaded from CSV:")
         else:
             loaded_students = pickle_serializer.load()
@@ -77,8 +91,9 @@ def run_assignment(choice: int):
             
         for stud in loaded_students:
             print(stud)
+        loaded_students = assignment1.IndexedStudentStore(loaded_students)
             
-        # Perform search operations.
+        # Perform search operations (answered from the street and house indexes).
         street = input("\nEnter a street name to search: ")
         found_students = csv_serializer.search_by_street(street, loaded_students)
         print(f"Students living on {street}:")
@@ -125,6 +140,243 @@ def run_assignment(choice: int):
         print("Exiting program.")
         sys.exit()
 
+# --- Headless batch mode ---
+
+_ASSIGNMENT_MODULES = {}
+
+def get_assignment_module(number: int):
+    """
+    Import assignment<number> on first use and return the cached module afterwards.
+    """
+    module = _ASSIGNMENT_MODULES.get(number)
+    if module is None:
+        module = importlib.import_module(f"assignment{number}")
+        _ASSIGNMENT_MODULES[number] = module
+    return module
+
+def _job_flag(params: dict, name: str) -> bool:
+    """
+    Read a boolean job parameter. Booleans and numbers (JSON values, or CSV cells coerced
+    to numbers) count by truthiness; strings enable it only as "1", "true", "yes" or "y".
+    """
+    value = params.get(name, "")
+    if isinstance(value, (bool, int, float)):
+        return bool(value)
+    return str(value).lower() in ("1", "true", "yes", "y")
+
+def _job_assignment1(params: dict) -> dict:
+    """
+    Load students (from 'source' file, or the sample list) and search them by 'street' and/or 'house'.
+    The 'format' parameter ('csv', 'pickle', 'binary' or 'sqlite') selects the serializer used
+    for 'source'; SQLite databases are searched with indexed queries instead of a loaded list.
+    """
+    assignment1 = get_assignment_module(1)
+    source = params.get("source")
+    file_format = params.get("format", "csv")
+    if source and file_format == "sqlite":
+        # Connecting would silently create an empty database in place of a missing file.
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"SQLite database '{source}' does not exist.")
+        with assignment1.SQLiteStudentSerializer(source) as serializer:
+            result = {"loaded": serializer.connection.execute("SELECT COUNT(*) FROM students").fetchone()[0]}
+            if params.get("street") not in (None, ""):
+                result["by_street"] = [str(s) for s in serializer.search_by_street(str(params["street"]))]
+            if params.get("house") not in (None, ""):
+                result["by_house"] = [str(s) for s in serializer.search_by_house(int(params["house"]))]
+        return result
+    if source:
+        if file_format == "pickle":
+            serializer = assignment1.PickleStudentSerializer(source)
+        elif file_format == "binary":
+            serializer = assignment1.BinaryStudentSerializer(source)
+        else:
+            serializer = assignment1.CSVStudentSerializer(source)
+        students = serializer.load()
+    else:
+        serializer = assignment1.StudentSerializer("")
+        students = assignment1.create_sample_students()
+    result = {"loaded": len(students)}
+    if params.get("street") not in (None, ""):
+        result["by_street"] = [str(s) for s in serializer.search_by_street(str(params["street"]), students)]
+    if params.get("house") not in (None, ""):
+        result["by_house"] = [str(s) for s in serializer.search_by_house(int(params["house"]), students)]
+    return result
+
+def _job_assignment2(params: dict) -> dict:
+    """
+    Analyze the text file 'source'; 'line' (1-based, default 1) selects the line for the detailed analysis.
+    With 'streaming' set, the file is read in chunks instead of being loaded into memory;
+    'incremental' additionally keeps the analysis state next to the file and only scans appended text.
+    """
+    assignment2 = get_assignment_module(2)
+    streaming = _job_flag(params, "streaming")
+    incremental = _job_flag(params, "incremental")
+    if streaming or incremental:
+        if incremental:
+            stats, line_count = assignment2.scan_text_file_incremental(params["source"])
+        else:
+            stats, line_count = assignment2.scan_text_file(params["source"])
+        analyzer = assignment2.TextAnalyzer("", stats)
+        analyze_line = lambda number: assignment2.analyze_file_line(params["source"], number)[1]
+    else:
+        full_text = assignment2.read_text_file(params["source"])
+        analyzer = assignment2.TextAnalyzer(full_text)
+        lines = full_text.splitlines()
+        line_count = len(lines)
+        analyze_line = lambda number: assignment2.analyze_specific_line(lines[number - 1])
+    result = {
+        "sentences": analyzer.analyze_sentences(),
+        "average_sentence_length": analyzer.average_sentence_length(),
+        "average_word_length": analyzer.average_word_length(),
+        "emoticons": analyzer.count_emoticons(),
+        "dates": analyzer.extract_dates(),
+        "special_words": analyzer.extract_special_words(),
+    }
+    if line_count:
+        line_num = int(params.get("line", 1))
+        if not 1 <= line_num <= line_count:
+            raise ValueError(f"line must be between 1 and {line_count}.")
+        result["line"] = line_num
+        result["line_analysis"] = analyze_line(line_num)
+    return result
+
+def _job_assignment3(params: dict) -> dict:
+    """
+    Compute the series for 'x' with precision 'eps'; 'accelerate' enables Wynn epsilon acceleration.
+    """
+    assignment3 = get_assignment_module(3)
+    x = float(params["x"])
+    eps = float(params["eps"])
+    if abs(x) >= 1 or eps <= 0:
+        raise ValueError("x must satisfy |x| < 1 and eps must be positive.")
+    accelerate = _job_flag(params, "accelerate")
+    F_series, n_terms = assignment3.compute_series_with_precision(x, eps, accelerate=accelerate)
+    return {"x": x, "n": n_terms, "F_series": F_series, "F_math": 1 / (1 - x), "eps": eps}
+
+def _job_assignment4(params: dict) -> dict:
+    """
+    Build a 'rectangle' (width, height) or 'parallelogram' (a, b, angle) and compute its area.
+    The figure is drawn only when 'save_filename' is given; it is saved and closed without being shown.
+    """
+    assignment4 = get_assignment_module(4)
+    figure = params.get("figure", "rectangle")
+    color = params.get("color", "green")
+    annotation = params.get("annotation", "")
+    save_filename = params.get("save_filename")
+    if figure == "rectangle":
+        rect = assignment4.Rectangle(float(params["width"]), float(params["height"]), color)
+        if save_filename:
+            assignment4.draw_rectangle(rect, annotation=annotation, save_filename=save_filename,
+                                       interactive=False)
+        return {"figure": str(rect), "area": rect.area()}
+    if figure == "parallelogram":
+        a, b, angle = float(params["a"]), float(params["b"]), float(params["angle"])
+        if save_filename:
+            assignment4.draw_parallelogram(a, b, angle, color=color, annotation=annotation,
+                                           save_filename=save_filename, interactive=False)
+        area = a * b * abs(math.sin(math.radians(angle)))
+        return {"figure": f"Parallelogram: a={a}, b={b}, angle={angle}", "area": area}
+    raise ValueError("figure must be 'rectangle' or 'parallelogram'.")
+
+def _job_assignment5(params: dict) -> dict:
+    """
+    Create a random n x m matrix (optionally with 'seed') and compute its statistics.
+    """
+    assignment5 = get_assignment_module(5)
+    n, m = int(params["n"]), int(params["m"])
+    if n <= 0 or m <= 0:
+        raise ValueError("Both dimensions must be positive integers.")
+    if params.get("seed") not in (None, ""):
+        assignment5.np.random.seed(int(params["seed"]))
+    matrix = assignment5.create_matrix(n, m)
+    last_row = matrix[-1, :]
+    return {
+        "matrix": matrix,
+        "statistics": assignment5.compute_statistics(matrix),
+        "sorted_last_row": assignment5.sort_last_row(matrix),
+        "median_last_row": assignment5.np.median(last_row),
+        "manual_median_last_row": assignment5.manual_median(last_row),
+    }
+
+JOB_HANDLERS = {
+    1: _job_assignment1,
+    2: _job_assignment2,
+    3: _job_assignment3,
+    4: _job_assignment4,
+    5: _job_assignment5,
+}
+
+def run_job(job: dict) -> dict:
+    """
+    Run one batch job without any prompts.
+
+    Parameters:
+        job (dict): 'assignment' (1-5) plus the parameters of that assignment's handler.
+
+    Returns:
+        dict: The job result (may contain NumPy values; see _to_jsonable).
+    """
+    params = dict(job)
+    number = int(params.pop("assignment"))
+    handler = JOB_HANDLERS.get(number)
+    if handler is None:
+        raise ValueError(f"Unknown assignment number: {number}")
+    return handler(params)
+
+def _parse_csv_value(value: str):
+    """
+    Convert a CSV cell to int or float where possible.
+    """
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except ValueError:
+            pass
+    return value
+
+def read_jobs(filename: str) -> list:
+    """
+    Read jobs from a JSON file (a list of objects or {"jobs": [...]}) or a CSV file
+    with an 'assignment' column and one column per parameter (empty cells are skipped).
+    """
+    with open(filename, "r", newline='', encoding="utf-8") as f:
+        if filename.lower().endswith(".csv"):
+            return [{key: _parse_csv_value(value) for key, value in row.items() if value not in (None, "")}
+                    for row in csv.DictReader(f)]
+        data = json.load(f)
+    return data["jobs"] if isinstance(data, dict) else data
+
+def _to_jsonable(value):
+    """
+    json.dump fallback for NumPy arrays and scalars.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def run_batch(job_filename: str, output_filename: str) -> int:
+    """
+    Run all jobs from job_filename and write one JSON line per job to output_filename.
+    A failing job is reported with status 'error' and does not stop the batch.
+
+    Returns:
+        int: The number of failed jobs.
+    """
+    failures = 0
+    with open(output_filename, "w", encoding="utf-8") as out:
+        for index, job in enumerate(read_jobs(job_filename), start=1):
+            record = {"job": index, "assignment": job.get("assignment")}
+            try:
+                result = run_job(job)
+                record["status"] = "ok"
+                record["result"] = result
+            except Exception as e:
+                failures += 1
+                record["status"] = "error"
+                record["error"] = f"{type(e).__name__}: {e}"
+            out.write(json.dumps(record, default=_to_jsonable, ensure_ascii=False) + "\n")
+    return failures
+
 def main():
     """
     Main function for the integrated Lab #4 demo.
@@ -138,4 +390,12 @@ def main():
             break
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lab #4 integration menu and batch runner.")
+    parser.add_argument("--batch", metavar="JOBS", help="run jobs from a JSON or CSV file without prompts")
+    parser.add_argument("--output", default="batch_results.jsonl", help="result file for --batch")
+    args = parser.parse_args()
+    if args.batch:
+        failed = run_batch(args.batch, args.output)
+        print(f"Batch finished, results saved to {args.output} ({failed} failed).")
+        sys.exit(1 if failed else 0)
     main()
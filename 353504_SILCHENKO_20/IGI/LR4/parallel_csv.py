@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Program: Parallel CSV Ingestion of Student Records
+Lab Number: Lab #4, Task 1 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Loads a large students CSV file (as written by CSVStudentSerializer) using several processes.
+    The data part of the file is cut into byte ranges that start and end on line boundaries,
+    every range is parsed by a worker of a process pool, and the parsed chunks are merged in
+    file order. Workers return either Student lists or columnar StudentTable chunks, and the
+    loader reports its throughput in rows per second so the worker count can be sized.
+
+    Ranges are aligned to newlines, so fields must not contain embedded line breaks
+    (CSVStudentSerializer never writes any for student records).
+"""
+
+import csv
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from assignment1 import Student
+from student_table import StudentTable
+
+
+def split_line_ranges(filename: str, chunk_bytes: int) -> tuple:
+    """
+    Split the data part of a CSV file into line-aligned byte ranges.
+
+    Parameters:
+        filename (str): The CSV file.
+        chunk_bytes (int): Approximate size of one range.
+
+    Returns:
+        tuple: (header_line, ranges) where header_line is the decoded first line and
+        ranges is a list of (start, end) byte offsets covering all following lines.
+    """
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        header_line = f.readline().decode("utf-8")
+        data_start = f.tell()
+        boundaries = [data_start]
+        position = data_start
+        while position + chunk_bytes < size:
+            f.seek(position + chunk_bytes)
+            f.readline()
+            position = f.tell()
+            if position >= size:
+                break
+            boundaries.append(position)
+    boundaries.append(size)
+    return header_line, [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _parse_range(filename: str, fieldnames: list, start: int, end: int, columnar: bool) -> tuple:
+    """
+    Worker: parse the rows of one byte range.
+
+    Returns:
+        tuple: (chunk, bad_rows) where chunk is a StudentTable if columnar, else a list of Students.
+    """
+    with open(filename, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)
+    bad_rows = 0
+    if columnar:
+        surname, street, house, apartment = [], [], [], []
+        for row in reader:
+            try:
+                row_house, row_apartment = int(row["house"]), int(row["apartment"])
+                row_surname, row_street = row["surname"], row["street"]
+                if row_surname is None or row_street is None:
+                    raise KeyError("surname/street")
+            except (ValueError, KeyError, TypeError):
+                bad_rows += 1
+                continue
+            surname.append(row_surname)
+            street.append(row_street)
+            house.append(row_house)
+            apartment.append(row_apartment)
+        return StudentTable.from_columns(surname, street, house, apartment), bad_rows
+    students = []
+    for row in reader:
+        try:
+            students.append(Student(row["surname"], row["street"], int(row["house"]), int(row["apartment"])))
+        except (ValueError, KeyError, TypeError):
+            bad_rows += 1
+    return students, bad_rows
+
+
+def load_csv_parallel(filename: str, workers: int = None, chunk_bytes: int = 8 << 20,
+                      columnar: bool = False) -> tuple:
+    """
+    Load a students CSV file with a process pool.
+
+    Parameters:
+        filename (str): The CSV file.
+        workers (int): Number of worker processes (default: os.cpu_count()); 1 parses in-process.
+        chunk_bytes (int): Approximate number of bytes per task.
+        columnar (bool): Return a StudentTable instead of a list of Student objects.
+
+    Returns:
+        tuple: (students, stats) where students is a list of Student objects (or a StudentTable)
+        in file order, and stats is a dictionary with 'rows', 'bad_rows', 'chunks', 'workers',
+        'seconds' and 'rows_per_second'.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or chunk_bytes <= 0:
+        raise ValueError("workers and chunk_bytes must be positive.")
+    started = time.perf_counter()
+
+    if not os.path.exists(filename):
+        chunks = []
+    else:
+        header_line, ranges = split_line_ranges(filename, chunk_bytes)
+        fieldnames = next(csv.reader([header_line]), [])
+        if workers == 1 or len(ranges) <= 1:
+            chunks = [_parse_range(filename, fieldnames, start, end, columnar) for start, end in ranges]
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+                futures = [pool.submit(_parse_range, filename, fieldnames, start, end, columnar)
+                           for start, end in ranges]
+                chunks = [future.result() for future in futures]
+
+    if columnar:
+        students = StudentTable.concat(chunk for chunk, _ in chunks)
+    else:
+        students = [student for chunk, _ in chunks for student in chunk]
+    seconds = time.perf_counter() - started
+    stats = {
+        "rows": len(students),
+        "bad_rows": sum(bad for _, bad in chunks),
+        "chunks": len(chunks),
+        "workers": workers,
+        "seconds": seconds,
+        "rows_per_second": len(students) / seconds if seconds > 0 else float("inf"),
+    }
+    return students, stats
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python parallel_csv.py students.csv [workers ...]")
+        sys.exit(1)
+    for count in [int(arg) for arg in sys.argv[2:]] or [1, os.cpu_count() or 1]:
+        _, run_stats = load_csv_parallel(sys.argv[1], workers=count, columnar=True)
+        print(f"workers={count}: {run_stats['rows']} rows in {run_stats['seconds']:.3f} s "
+              f"({run_stats['rows_per_second']:,.0f} rows/s)")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Program: Wynn Epsilon Acceleration of Partial Sums
+Lab Number: Lab #4, Task 3 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Accelerates a sequence of partial sums with the Wynn epsilon algorithm.
+    assignment3.compute_series_accelerated supplies the partial sums and the
+    convergence test, so the summation rule of compute_series_with_precision stays unchanged.
+"""
+
+import math
+
+
+def wynn_epsilon_step(diagonal: list, partial_sum: float) -> tuple:
+    """
+    Add one partial sum to the Wynn epsilon table.
+
+    Only the last ascending diagonal of the table is kept: diagonal[k] is
+    eps_k for the most recent partial sums, eps_0 being the partial sums.
+    The even columns eps_2, eps_4, ... are the Shanks transforms.
+
+    Parameters:
+        diagonal (list): The previous diagonal (empty before the first term).
+        partial_sum (float): The next partial sum of the series.
+
+    Returns:
+        tuple: (new_diagonal, estimate), where estimate is the entry of the
+        highest even column.
+    """
+    new_diagonal = [partial_sum]
+    for k, old in enumerate(diagonal):
+        diff = new_diagonal[k] - old
+        if diff == 0:
+            # The column has converged exactly; higher columns are undefined.
+            break
+        previous = diagonal[k - 1] if k > 0 else 0.0
+        new_diagonal.append(previous + 1 / diff)
+    estimate = new_diagonal[(len(new_diagonal) - 1) // 2 * 2]
+    return new_diagonal, estimate
+
+
+def wynn_accelerate(partial_sums, converged) -> tuple:
+    """
+    Accelerate a sequence of partial sums until an estimate is accepted.
+
+    Every partial sum is passed through the epsilon table. The first estimate
+    for which converged(estimate) is true is returned. If the sums run out first,
+    the estimate that changed least from the one before it is returned instead of
+    the last one, because far in the table rounding errors make the last
+    estimates drift.
+
+    Parameters:
+        partial_sums (iterable): The partial sums S_1, S_2, ... of the series.
+        converged (callable): Acceptance test for an estimate.
+
+    Returns:
+        tuple: (n, estimate) - the number of partial sums used and the estimate.
+    """
+    diagonal = []
+    n = 0
+    estimate = 0.0
+    previous = None
+    best_n, best, best_change = 0, 0.0, math.inf
+    for n, partial_sum in enumerate(partial_sums, start=1):
+        diagonal, estimate = wynn_epsilon_step(diagonal, partial_sum)
+        if converged(estimate):
+            return n, estimate
+        if previous is not None:
+            change = abs(estimate - previous)
+            if change < best_change:
+                best_n, best, best_change = n, estimate, change
+        previous = estimate
+    if best_change < math.inf:
+        return best_n, best
+    return n, estimate
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Program: Parallel Parameter Sweeps for the Series Expansion
+Lab Number: Lab #4, Task 3 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Evaluates the power series of f(x)=1/(1-x) over dense (x, eps) grids using several processes.
+    The grid is split into contiguous chunks that are handed out to a process pool. Inputs and
+    results live in a single shared-memory record array, so workers only receive the chunk
+    boundaries and write their rows in place instead of pickling results back. Every chunk owns
+    a fixed slice of the array, which keeps the output order identical to the input order
+    regardless of the number of workers.
+
+    Any batch kernel with the signature kernel(x, eps, max_iter) -> (n, series_sum, exact_value, error)
+    can be used, e.g. compute_series_batch from assignment3.py (the default) or
+    calculate_series_batch from LR3/business_functions.py. The kernel must be a module-level
+    function so that it can be passed to the worker processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from assignment3 import compute_series_batch
+
+# Layout of one row of the shared result array.
+SWEEP_DTYPE = np.dtype([
+    ("x", np.float64),
+    ("eps", np.float64),
+    ("n", np.int64),
+    ("series_sum", np.float64),
+    ("exact_value", np.float64),
+    ("error", np.float64),
+])
+
+
+def make_grid(x_values, eps_values) -> tuple:
+    """
+    Build a dense grid from 1D arrays of x and eps values.
+
+    Parameters:
+        x_values (array_like): Values of x (|x| < 1).
+        eps_values (array_like): Precision values.
+
+    Returns:
+        tuple: (x, eps) flattened arrays covering every combination, x varying slowest.
+    """
+    x_grid, eps_grid = np.meshgrid(np.asarray(x_values, dtype=float),
+                                   np.asarray(eps_values, dtype=float), indexing="ij")
+    return x_grid.ravel(), eps_grid.ravel()
+
+
+def _sweep_chunk(shm_name: str, size: int, start: int, stop: int, max_iter: int, kernel) -> int:
+    """
+    Worker: evaluate rows [start, stop) of the shared array in place.
+
+    Returns:
+        int: The number of processed rows.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        table = np.ndarray((size,), dtype=SWEEP_DTYPE, buffer=shm.buf)
+        _fill_rows(table[start:stop], max_iter, kernel)
+        del table
+    finally:
+        shm.close()
+    return stop - start
+
+
+def _fill_rows(rows: np.ndarray, max_iter: int, kernel):
+    """
+    Run the kernel on the x and eps columns of rows and store its output in the other columns.
+    """
+    n, series_sum, exact_value, error = kernel(rows["x"], rows["eps"], max_iter)
+    rows["n"] = n
+    rows["series_sum"] = series_sum
+    rows["exact_value"] = exact_value
+    rows["error"] = error
+
+
+def run_sweep(x, eps, workers: int = None, chunk_size: int = 65536, max_iter: int = 500,
+              kernel=compute_series_batch) -> np.ndarray:
+    """
+    Evaluate the series over all (x, eps) pairs using a process pool.
+
+    Parameters:
+        x (array_like): Values of x, broadcast against eps.
+        eps (array_like): Precision values.
+        workers (int): Number of worker processes (default: os.cpu_count()).
+            With workers=1 the sweep runs in the calling process.
+        chunk_size (int): Number of grid points per task.
+        max_iter (int): Maximum number of series terms (default is 500).
+        kernel (callable): Batch series kernel (default: compute_series_batch).
+
+    Returns:
+        np.ndarray: Record array of dtype SWEEP_DTYPE with the broadcast shape of x and eps,
+        in the same order as the input.
+
+    Raises:
+        ValueError: If workers or chunk_size is not positive.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0 or chunk_size <= 0:
+        raise ValueError("workers and chunk_size must be positive.")
+
+    x, eps = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(eps, dtype=float))
+    shape = x.shape
+    size = x.size
+    bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+    if workers == 1 or len(bounds) <= 1:
+        table = np.empty(size, dtype=SWEEP_DTYPE)
+        table["x"] = x.ravel()
+        table["eps"] = eps.ravel()
+        for start, stop in bounds:
+            _fill_rows(table[start:stop], max_iter, kernel)
+        return table.reshape(shape)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size * SWEEP_DTYPE.itemsize, 1))
+    try:
+        shared = np.ndarray((size,), dtype=SWEEP_DTYPE, buffer=shm.buf)
+        shared["x"] = x.ravel()
+        shared["eps"] = eps.ravel()
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+            futures = [pool.submit(_sweep_chunk, shm.name, size, start, stop, max_iter, kernel)
+                       for start, stop in bounds]
+            for future in futures:
+                future.result()
+        table = shared.copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return table.reshape(shape)
+
+
+if __name__ == "__main__":
+    import time
+
+    x_grid, eps_grid = make_grid(np.linspace(-0.99, 0.99, 2001), np.logspace(-12, -1, 100))
+    for count in (1, os.cpu_count() or 1):
+        started = time.perf_counter()
+        result = run_sweep(x_grid, eps_grid, workers=count)
+        elapsed = time.perf_counter() - started
+        print(f"workers={count}: {result.size} points in {elapsed:.3f} s, max n = {result['n'].max()}")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Program: Sorted Index Queries over Student Records
+Lab Number: Lab #4, Task 1 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Provides SortedStudentIndex, a read-only query engine over a snapshot of student records.
+    The records are sorted once by house number, by surname and by case-folded street, and
+    every query finds its boundaries in the matching sorted key list with bisect:
+        - house_range: students whose house number lies in [low, high];
+        - surname_prefix / street_prefix: students whose surname or street starts with a prefix;
+        - page_by_surname: the next k students in surname order after a cursor.
+    Each query costs O(log n + k) for k results, compared to the O(n) scans of StudentSerializer.
+"""
+
+from bisect import bisect_left, bisect_right
+
+# Sorts after every character, so prefix + _MAX_CHAR bounds all strings starting with prefix.
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class SortedStudentIndex:
+    """
+    Sorted indexes over a snapshot of student records.
+
+    Ties in every index keep the original order of the records. Surname queries are
+    case-sensitive, like Student.__lt__; street queries are case-insensitive, like
+    the street searches of StudentSerializer. The index does not follow later changes
+    to the records: build a new one after modifying them.
+    """
+
+    def __init__(self, students=()):
+        students = list(students)
+        by_house = sorted(range(len(students)), key=lambda i: students[i].house)
+        self._house_keys = [students[i].house for i in by_house]
+        self._by_house = [students[i] for i in by_house]
+
+        # (surname, position) keys are unique, so they also serve as pagination cursors.
+        self._surname_keys = sorted((student.surname, i) for i, student in enumerate(students))
+        self._by_surname = [students[i] for _, i in self._surname_keys]
+        self._surnames = [surname for surname, _ in self._surname_keys]
+
+        by_street = sorted(range(len(students)), key=lambda i: students[i].street.casefold())
+        self._street_keys = [students[i].street.casefold() for i in by_street]
+        self._by_street = [students[i] for i in by_street]
+
+    @classmethod
+    def from_serializer(cls, serializer) -> "SortedStudentIndex":
+        """
+        Build an index from the records of a StudentSerializer, streamed through iter_load when available.
+        """
+        if hasattr(serializer, "iter_load"):
+            return cls(serializer.iter_load())
+        return cls(serializer.load())
+
+    def __len__(self):
+        return len(self._by_house)
+
+    def house_range(self, low: int = None, high: int = None) -> list:
+        """
+        Return students whose house number lies in [low, high], ordered by house number.
+
+        Parameters:
+            low (int): The smallest house number (default: no lower bound).
+            high (int): The largest house number (default: no upper bound).
+        """
+        start = 0 if low is None else bisect_left(self._house_keys, low)
+        end = len(self._house_keys) if high is None else bisect_right(self._house_keys, high)
+        return self._by_house[start:end]
+
+    def surname_prefix(self, prefix: str) -> list:
+        """
+        Return students whose surname starts with prefix (case-sensitive), ordered by surname.
+        """
+        start = bisect_left(self._surnames, prefix)
+        end = bisect_left(self._surnames, prefix + _MAX_CHAR, start)
+        return self._by_surname[start:end]
+
+    def street_prefix(self, prefix: str) -> list:
+        """
+        Return students whose street starts with prefix (case-insensitive), ordered by street.
+        """
+        prefix = prefix.casefold()
+        start = bisect_left(self._street_keys, prefix)
+        end = bisect_left(self._street_keys, prefix + _MAX_CHAR, start)
+        return self._by_street[start:end]
+
+    def page_by_surname(self, limit: int, after=None) -> tuple:
+        """
+        Return the next students in surname order after a cursor.
+
+        Parameters:
+            limit (int): The maximum number of students to return.
+            after: The cursor returned by the previous call (default: start from the first student).
+
+        Returns:
+            tuple: (students, cursor) where cursor is passed as 'after' to fetch the following
+            page, or None when there are no more students.
+
+        Raises:
+            ValueError: If limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive.")
+        start = 0 if after is None else bisect_right(self._surname_keys, tuple(after))
+        end = min(start + limit, len(self._surname_keys))
+        cursor = self._surname_keys[end - 1] if end < len(self._surname_keys) else None
+        return self._by_surname[start:end], cursor
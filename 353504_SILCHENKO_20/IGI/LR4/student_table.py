@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Program: Columnar Student Records
+Lab Number: Lab #4, Task 1 (Extension)
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Provides StudentTable, a column-oriented alternative to a list of Student objects.
+    House and apartment numbers are stored in typed NumPy arrays, while surnames and streets
+    are dictionary-encoded: each column holds integer codes into a list of distinct strings.
+    Filtering and sorting work on whole columns at once, and tables convert to and from
+    Student lists and the serializers of assignment1.py.
+"""
+
+import numpy as np
+
+from assignment1 import Student
+
+# Sortable columns of a StudentTable.
+COLUMNS = ("surname", "street", "house", "apartment")
+
+
+def _encode(values) -> tuple:
+    """
+    Dictionary-encode an iterable of strings.
+
+    Returns:
+        tuple: (codes, dictionary) where dictionary[codes[i]] == values[i].
+    """
+    lookup = {}
+    dictionary = []
+    codes = []
+    for value in values:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(dictionary)
+            dictionary.append(value)
+        codes.append(code)
+    return np.array(codes, dtype=np.int32), dictionary
+
+
+class StudentTable:
+    """
+    Column-oriented table of student records.
+
+    Attributes:
+        surname_codes (np.ndarray): int32 codes into surnames.
+        surnames (list): Distinct surnames.
+        street_codes (np.ndarray): int32 codes into streets.
+        streets (list): Distinct streets.
+        house (np.ndarray): int32 house numbers.
+        apartment (np.ndarray): int32 apartment numbers.
+    """
+
+    def __init__(self, surname_codes, surnames, street_codes, streets, house, apartment):
+        self.surname_codes = np.asarray(surname_codes, dtype=np.int32)
+        self.surnames = list(surnames)
+        self.street_codes = np.asarray(street_codes, dtype=np.int32)
+        self.streets = list(streets)
+        self.house = np.asarray(house, dtype=np.int32)
+        self.apartment = np.asarray(apartment, dtype=np.int32)
+
+    @classmethod
+    def from_columns(cls, surname, street, house, apartment) -> "StudentTable":
+        """
+        Build a table from plain columns (sequences of strings and integers).
+        """
+        surname_codes, surnames = _encode(surname)
+        street_codes, streets = _encode(street)
+        return cls(surname_codes, surnames, street_codes, streets, house, apartment)
+
+    @classmethod
+    def from_students(cls, students) -> "StudentTable":
+        """
+        Build a table from an iterable of Student objects.
+        """
+        surname, street, house, apartment = [], [], [], []
+        for student in students:
+            surname.append(student.surname)
+            street.append(student.street)
+            house.append(student.house)
+            apartment.append(student.apartment)
+        return cls.from_columns(surname, street, house, apartment)
+
+    @classmethod
+    def from_serializer(cls, serializer) -> "StudentTable":
+        """
+        Load a table through a StudentSerializer. Serializers with iter_load
+        (e.g. CSVStudentSerializer) are streamed without building a Student list.
+        """
+        if hasattr(serializer, "iter_load"):
+            return cls.from_students(serializer.iter_load())
+        return cls.from_students(serializer.load())
+
+    @classmethod
+    def concat(cls, tables) -> "StudentTable":
+        """
+        Concatenate tables in order, merging their string dictionaries.
+        """
+        tables = list(tables)
+        surnames, streets = [], []
+        surname_lookup, street_lookup = {}, {}
+        surname_parts, street_parts = [], []
+        for table in tables:
+            for dictionary, lookup, merged, codes, parts in (
+                    (table.surnames, surname_lookup, surnames, table.surname_codes, surname_parts),
+                    (table.streets, street_lookup, streets, table.street_codes, street_parts)):
+                remap = np.empty(len(dictionary), dtype=np.int32)
+                for code, value in enumerate(dictionary):
+                    new_code = lookup.get(value)
+                    if new_code is None:
+                        new_code = lookup[value] = len(merged)
+                        merged.append(value)
+                    remap[code] = new_code
+                parts.append(remap[codes])
+        empty = np.empty(0, dtype=np.int32)
+        return cls(np.concatenate(surname_parts or [empty]), surnames,
+                   np.concatenate(street_parts or [empty]), streets,
+                   np.concatenate([t.house for t in tables] or [empty]),
+                   np.concatenate([t.apartment for t in tables] or [empty]))
+
+    def __len__(self):
+        return len(self.house)
+
+    def __getitem__(self, index: int) -> Student:
+        return Student(self.surnames[self.surname_codes[index]], self.streets[self.street_codes[index]],
+                       int(self.house[index]), int(self.apartment[index]))
+
+    def __repr__(self):
+        return f"StudentTable({len(self)} rows, {len(self.surnames)} surnames, {len(self.streets)} streets)"
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a column as an array; string columns are decoded to an object array.
+        """
+        if name == "surname":
+            return np.array(self.surnames, dtype=object)[self.surname_codes]
+        if name == "street":
+            return np.array(self.streets, dtype=object)[self.street_codes]
+        if name in ("house", "apartment"):
+            return getattr(self, name)
+        raise ValueError(f"Unknown column: {name}")
+
+    def iter_students(self):
+        """
+        Lazily yield the rows as Student objects.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_students(self) -> list:
+        """
+        Return the rows as a list of Student objects.
+        """
+        return list(self.iter_students())
+
+    def save(self, serializer):
+        """
+        Save the table through a StudentSerializer.
+        """
+        serializer.save(self.iter_students())
+
+    def take(self, indices) -> "StudentTable":
+        """
+        Return a new table with the rows at the given indices (or boolean mask), sharing the dictionaries.
+        """
+        return StudentTable(self.surname_codes[indices], self.surnames, self.street_codes[indices],
+                            self.streets, self.house[indices], self.apartment[indices])
+
+    def street_mask(self, street: str) -> np.ndarray:
+        """
+        Return a boolean mask of rows on the given street (case-insensitive).
+        """
+        street = street.casefold()
+        codes = [code for code, value in enumerate(self.streets) if value.casefold() == street]
+        return np.isin(self.street_codes, codes)
+
+    def house_mask(self, house: int) -> np.ndarray:
+        """
+        Return a boolean mask of rows with the given house number.
+        """
+        return self.house == house
+
+    def filter(self, street: str = None, house: int = None) -> "StudentTable":
+        """
+        Return the rows matching every given condition.
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if street is not None:
+            mask &= self.street_mask(street)
+        if house is not None:
+            mask &= self.house_mask(house)
+        return self.take(mask)
+
+    def _sort_key(self, name: str) -> np.ndarray:
+        """
+        Return an integer array that orders rows like the values of the column.
+        String columns are ranked by the sorted order of their dictionary.
+        """
+        if name in ("surname", "street"):
+            dictionary = self.surnames if name == "surname" else self.streets
+            codes = self.surname_codes if name == "surname" else self.street_codes
+            ranks = np.empty(len(dictionary), dtype=np.int32)
+            ranks[sorted(range(len(dictionary)), key=dictionary.__getitem__)] = np.arange(len(dictionary))
+            return ranks[codes]
+        if name in ("house", "apartment"):
+            return getattr(self, name)
+        raise ValueError(f"Unknown column: {name}")
+
+    def argsort(self, *keys) -> np.ndarray:
+        """
+        Return the stable order of rows by the given columns (default: surname, like Student.__lt__).
+        """
+        keys = keys or ("surname",)
+        # np.lexsort sorts by its last key first.
+        return np.lexsort([self._sort_key(name) for name in reversed(keys)])
+
+    def sort_by(self, *keys) -> "StudentTable":
+        """
+        Return a new table sorted stably by the given columns (default: surname).
+        """
+        return self.take(self.argsort(*keys))
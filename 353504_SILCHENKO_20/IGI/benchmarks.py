@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+"""
+Program: Performance Benchmarks for Lab #3 and Lab #4
+Version: 1.0
+Developer: Сильченко Анна
+Date: 2026-10-17
+
+Purpose:
+    Runs the hot functions of LR3 and LR4 on synthetic inputs of several sizes and measures
+    the best time out of a few repetitions. Results can be saved as a JSON baseline; later
+    runs are compared against it and the program exits with status 1 when any benchmark
+    becomes slower than the baseline by more than the given threshold.
+
+Usage:
+    python benchmarks.py --save-baseline          # record benchmark_baseline.json
+    python benchmarks.py --threshold 1.25         # compare against it
+    python benchmarks.py --filter csv --list      # show matching benchmarks
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LR3_DIR = os.path.join(BASE_DIR, "LR3")
+LR4_DIR = os.path.join(BASE_DIR, "LR4")
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmark_baseline.json")
+
+for lab_dir in (LR3_DIR, LR4_DIR):
+    if lab_dir not in sys.path:
+        sys.path.insert(0, lab_dir)
+
+import business_functions
+import assignment1
+import assignment2
+import assignment3
+import assignment5
+import student_query
+import student_table
+
+
+def _load_module(name: str, path: str):
+    """
+    Import a module from a file under a unique name (both labs have a main.py).
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+lr3_main = _load_module("lr3_main", os.path.join(LR3_DIR, "main.py"))
+
+# Scratch directory for serializer files, removed when the program exits.
+_SCRATCH = tempfile.TemporaryDirectory(prefix="lr_bench_")
+
+# Registered benchmarks: name -> (setup, sizes). setup(size) returns a callable to time.
+BENCHMARKS = {}
+
+
+def benchmark(name: str, sizes: tuple):
+    """
+    Register a benchmark setup function under the given name for the given input sizes.
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, sizes)
+        return setup
+    return register
+
+
+# --- Synthetic inputs ---
+
+WORDS = ["alpha", "beta", "gamma", "delta", "street", "house", "lenina", "kirova", "river",
+         "garden", "window", "summer", "coffee", "table", "\"quoted\"", "«cited»", "Rabbit"]
+
+
+def make_text(word_count: int, seed: int = 0) -> str:
+    """
+    Build a text of word_count words with commas, sentence ends, emoticons and 2007 dates.
+    """
+    rng = random.Random(seed)
+    parts = []
+    for i in range(1, word_count + 1):
+        parts.append(rng.choice(WORDS))
+        if i % 97 == 0:
+            parts.append(":-))")
+        if i % 131 == 0:
+            parts.append(f"{rng.randint(1, 28)}.{rng.randint(1, 12)}.2007")
+        if i % 12 == 0:
+            parts[-1] += rng.choice(".!?")
+        elif i % 5 == 0:
+            parts[-1] += ","
+    return " ".join(parts) + "."
+
+
+def make_students(count: int, seed: int = 0) -> list:
+    """
+    Build count random Student objects.
+    """
+    rng = random.Random(seed)
+    streets = ["Lenina", "Kirova", "Pushkina", "Alferova", "Gorkogo", "Nezavisimosti"]
+    return [
+        assignment1.Student("".join(rng.choices(string.ascii_lowercase, k=8)).capitalize(),
+                            rng.choice(streets), rng.randint(1, 200), rng.randint(1, 500))
+        for _ in range(count)
+    ]
+
+
+def make_series_points(count: int, seed: int = 0) -> list:
+    """
+    Build count (x, eps) pairs with |x| < 0.99.
+    """
+    rng = random.Random(seed)
+    return [(rng.uniform(-0.99, 0.99), 10 ** rng.uniform(-9, -2)) for _ in range(count)]
+
+
+# --- Series ---
+
+@benchmark("lr3.calculate_series", (10, 100, 1000))
+def bench_calculate_series(size):
+    points = make_series_points(size)
+    return lambda: [business_functions.calculate_series(x, eps) for x, eps in points]
+
+
+@benchmark("lr4.compute_series_with_precision", (10, 100, 1000))
+def bench_compute_series_with_precision(size):
+    points = make_series_points(size)
+    return lambda: [assignment3.compute_series_with_precision(x, eps) for x, eps in points]
+
+
+# --- LR3 text functions ---
+
+@benchmark("lr3.letter_frequency", (1000, 10000, 100000))
+def bench_letter_frequency(size):
+    text = make_text(size)
+    return lambda: lr3_main.letter_frequency(text)
+
+
+@benchmark("lr3.count_quoted_words", (1000, 10000, 100000))
+def bench_count_quoted_words(size):
+    text = make_text(size)
+    return lambda: lr3_main.count_quoted_words(text)
+
+
+@benchmark("lr3.sorted_comma_phrases", (1000, 10000, 100000))
+def bench_sorted_comma_phrases(size):
+    text = make_text(size)
+    return lambda: lr3_main.sorted_comma_phrases(text)
+
+
+# --- Student serializers ---
+
+def _serializer_benchmark(serializer_class, suffix: str, size: int, operation: str):
+    """
+    Prepare a save or load benchmark for a serializer writing to a temporary file.
+    """
+    students = make_students(size)
+    path = os.path.join(_SCRATCH.name, f"students_{operation}_{size}{suffix}")
+    serializer = serializer_class(path)
+    serializer.save(students)
+    if operation == "save":
+        return lambda: serializer.save(students)
+    return serializer.load
+
+
+@benchmark("lr4.CSVStudentSerializer.save", (100, 1000, 10000))
+def bench_csv_save(size):
+    return _serializer_benchmark(assignment1.CSVStudentSerializer, ".csv", size, "save")
+
+
+@benchmark("lr4.CSVStudentSerializer.load", (100, 1000, 10000))
+def bench_csv_load(size):
+    return _serializer_benchmark(assignment1.CSVStudentSerializer, ".csv", size, "load")
+
+
+@benchmark("lr4.PickleStudentSerializer.save", (100, 1000, 10000))
+def bench_pickle_save(size):
+    return _serializer_benchmark(assignment1.PickleStudentSerializer, ".pkl", size, "save")
+
+
+@benchmark("lr4.PickleStudentSerializer.load", (100, 1000, 10000))
+def bench_pickle_load(size):
+    return _serializer_benchmark(assignment1.PickleStudentSerializer, ".pkl", size, "load")
+
+
+@benchmark("lr4.StudentSerializer.search_by_street", (100, 1000, 10000))
+def bench_search_by_street_scan(size):
+    students = make_students(size)
+    serializer = assignment1.StudentSerializer("")
+    return lambda: serializer.search_by_street("lenina", students)
+
+
+@benchmark("lr4.IndexedStudentStore.search_by_street", (100, 1000, 10000))
+def bench_search_by_street_indexed(size):
+    store = assignment1.IndexedStudentStore(make_students(size))
+    serializer = assignment1.StudentSerializer("")
+    return lambda: serializer.search_by_street("lenina", store)
+
+
+@benchmark("lr4.IndexedStudentStore.search_by_street_and_house", (100, 1000, 10000))
+def bench_search_by_street_and_house_indexed(size):
+    store = assignment1.IndexedStudentStore(make_students(size))
+    serializer = assignment1.StudentSerializer("")
+    return lambda: serializer.search_by_street_and_house("lenina", 10, store)
+
+
+@benchmark("lr4.sorted(students)", (1000, 10000, 100000))
+def bench_sort_students(size):
+    students = make_students(size)
+    return lambda: sorted(students)
+
+
+@benchmark("lr4.StudentTable.sort_by", (1000, 10000, 100000))
+def bench_sort_student_table(size):
+    table = student_table.StudentTable.from_students(make_students(size))
+    return table.sort_by
+
+
+@benchmark("lr4.StudentTable.filter", (1000, 10000, 100000))
+def bench_filter_student_table(size):
+    table = student_table.StudentTable.from_students(make_students(size))
+    return lambda: table.filter(street="lenina", house=10)
+
+
+@benchmark("lr4.BinaryStudentSerializer.save", (100, 1000, 10000))
+def bench_binary_save(size):
+    return _serializer_benchmark(assignment1.BinaryStudentSerializer, ".bin", size, "save")
+
+
+@benchmark("lr4.BinaryStudentSerializer.load", (100, 1000, 10000))
+def bench_binary_load(size):
+    return _serializer_benchmark(assignment1.BinaryStudentSerializer, ".bin", size, "load")
+
+
+@benchmark("lr4.BinaryStudentReader.open+getitem", (100, 1000, 10000))
+def bench_binary_random_access(size):
+    serializer = assignment1.BinaryStudentSerializer(
+        os.path.join(_SCRATCH.name, f"students_random_{size}.bin"))
+    serializer.save(make_students(size))
+
+    def open_and_get():
+        with serializer.open() as reader:
+            return reader[size // 2]
+    return open_and_get
+
+
+@benchmark("lr4.SQLiteStudentSerializer.save", (100, 1000, 10000))
+def bench_sqlite_save(size):
+    return _serializer_benchmark(assignment1.SQLiteStudentSerializer, ".db", size, "save")
+
+
+@benchmark("lr4.SQLiteStudentSerializer.load", (100, 1000, 10000))
+def bench_sqlite_load(size):
+    return _serializer_benchmark(assignment1.SQLiteStudentSerializer, ".db", size, "load")
+
+
+@benchmark("lr4.SQLiteStudentSerializer.search_by_street_and_house", (100, 1000, 10000))
+def bench_sqlite_search(size):
+    serializer = assignment1.SQLiteStudentSerializer(
+        os.path.join(_SCRATCH.name, f"students_search_{size}.db"))
+    serializer.save(make_students(size))
+    return lambda: serializer.search_by_street_and_house("lenina", 10)
+
+
+def _fan_out_serializers(size: int) -> list:
+    """
+    Create CSV, pickle and binary serializers writing to temporary files.
+    """
+    return [serializer_class(os.path.join(_SCRATCH.name, f"students_fan_out_{size}{suffix}"))
+            for serializer_class, suffix in ((assignment1.CSVStudentSerializer, ".csv"),
+                                             (assignment1.PickleStudentSerializer, ".pkl"),
+                                             (assignment1.BinaryStudentSerializer, ".bin"))]
+
+
+@benchmark("lr4.save_each_format", (100, 1000, 10000))
+def bench_save_sequential(size):
+    students = make_students(size)
+    serializers = _fan_out_serializers(size)
+    return lambda: [serializer.save(students) for serializer in serializers]
+
+
+@benchmark("lr4.save_all", (100, 1000, 10000))
+def bench_save_all(size):
+    students = make_students(size)
+    serializers = _fan_out_serializers(size)
+    return lambda: assignment1.save_all(students, serializers)
+
+
+# --- Sorted index queries (each paired with the equivalent linear scan) ---
+
+@benchmark("lr4.scan.house_range", (1000, 10000, 100000))
+def bench_house_range_scan(size):
+    students = make_students(size)
+    return lambda: [s for s in students if 10 <= s.house <= 12]
+
+
+@benchmark("lr4.SortedStudentIndex.house_range", (1000, 10000, 100000))
+def bench_house_range_indexed(size):
+    index = student_query.SortedStudentIndex(make_students(size))
+    return lambda: index.house_range(10, 12)
+
+
+@benchmark("lr4.scan.surname_prefix", (1000, 10000, 100000))
+def bench_surname_prefix_scan(size):
+    students = make_students(size)
+    return lambda: [s for s in students if s.surname.startswith("Ab")]
+
+
+@benchmark("lr4.SortedStudentIndex.surname_prefix", (1000, 10000, 100000))
+def bench_surname_prefix_indexed(size):
+    index = student_query.SortedStudentIndex(make_students(size))
+    return lambda: index.surname_prefix("Ab")
+
+
+@benchmark("lr4.scan.street_prefix", (1000, 10000, 100000))
+def bench_street_prefix_scan(size):
+    students = make_students(size)
+    return lambda: [s for s in students if s.street.casefold().startswith("len")]
+
+
+@benchmark("lr4.SortedStudentIndex.street_prefix", (1000, 10000, 100000))
+def bench_street_prefix_indexed(size):
+    index = student_query.SortedStudentIndex(make_students(size))
+    return lambda: index.street_prefix("len")
+
+
+@benchmark("lr4.scan.page_by_surname", (1000, 10000, 100000))
+def bench_page_by_surname_scan(size):
+    students = make_students(size)
+    cursor = sorted(students)[size // 2].surname
+    return lambda: sorted(s for s in students if s.surname > cursor)[:20]
+
+
+@benchmark("lr4.SortedStudentIndex.page_by_surname", (1000, 10000, 100000))
+def bench_page_by_surname_indexed(size):
+    index = student_query.SortedStudentIndex(make_students(size))
+    _, cursor = index.page_by_surname(size // 2)
+    return lambda: index.page_by_surname(20, cursor)
+
+
+# --- TextAnalyzer ---
+
+@benchmark("lr4.TextAnalyzer.__init__", (1000, 10000, 100000))
+def bench_text_analyzer_init(size):
+    text = make_text(size)
+    return lambda: assignment2.TextAnalyzer(text)
+
+
+def _text_analyzer_method(method_name: str):
+    """
+    Register a benchmark for one TextAnalyzer method on a prebuilt analyzer.
+    """
+    @benchmark(f"lr4.TextAnalyzer.{method_name}", (1000, 10000, 100000))
+    def bench(size):
+        return getattr(assignment2.TextAnalyzer(make_text(size)), method_name)
+    return bench
+
+
+for _method in ("analyze_sentences", "average_sentence_length", "average_word_length",
+                "count_emoticons", "extract_dates", "extract_special_words"):
+    _text_analyzer_method(_method)
+
+
+@benchmark("lr4.scan_text_file", (10000, 100000))
+def bench_scan_text_file(size):
+    path = os.path.join(_SCRATCH.name, f"text_{size}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(make_text(size))
+    return lambda: assignment2.scan_text_file(path, chunk_size=1 << 16)
+
+
+@benchmark("lr4.scan_text_parallel", (100000, 1000000))
+def bench_scan_text_parallel(size):
+    text = make_text(size)
+    return lambda: assignment2.scan_text_parallel(text)
+
+
+# --- NumPy statistics ---
+
+@benchmark("lr4.assignment5.compute_statistics", (10, 100, 500))
+def bench_matrix_statistics(size):
+    matrix = np.random.default_rng(0).integers(0, 101, size=(size, size))
+    return lambda: assignment5.compute_statistics(matrix)
+
+
+@benchmark("lr4.assignment5.manual_median", (1000, 100000, 1000000))
+def bench_manual_median(size):
+    arr = np.random.default_rng(0).integers(0, 101, size=size)
+    return lambda: assignment5.manual_median(arr)
+
+
+# --- Runner ---
+
+def measure(func, repeat: int = 5, min_time: float = 0.05) -> float:
+    """
+    Return the best time per call of func in seconds.
+
+    The number of calls per repetition is increased until a repetition takes at least
+    min_time, so that very fast functions are not dominated by timer resolution.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_benchmarks(name_filter: str = "", repeat: int = 5, min_time: float = 0.05) -> dict:
+    """
+    Run all registered benchmarks whose name contains name_filter.
+
+    Returns:
+        dict: Mapping "name[size]" -> best time per call in seconds.
+    """
+    results = {}
+    for name, (setup, sizes) in BENCHMARKS.items():
+        if name_filter not in name:
+            continue
+        for size in sizes:
+            key = f"{name}[{size}]"
+            results[key] = measure(setup(size), repeat, min_time)
+            print(f"{key:<55} {results[key] * 1e3:12.4f} ms")
+    return results
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Return (key, baseline_time, current_time) for every result slower than threshold * baseline.
+    """
+    return [(key, baseline[key], current) for key, current in results.items()
+            if key in baseline and current > baseline[key] * threshold]
+
+
+def main(argv=None) -> int:
+    """
+    Command-line entry point. Returns the process exit status.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the hot functions of LR3 and LR4.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="fail when current time > threshold * baseline time (default 1.25)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per benchmark (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per repetition")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, sizes) in BENCHMARKS.items():
+            if args.filter in name:
+                print(f"{name} {list(sizes)}")
+        return 0
+
+    results = run_benchmarks(args.filter, args.repeat, args.min_time)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline first.")
+        return 0
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nRegressions (slower than {args.threshold:.2f} x baseline):")
+        for key, old, new in regressions:
+            print(f"  {key}: {old * 1e3:.4f} ms -> {new * 1e3:.4f} ms ({new / old:.2f}x)")
+        return 1
+    print(f"\nNo regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())